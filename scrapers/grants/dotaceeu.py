@@ -10,25 +10,26 @@ Scrapes grant calls from dotaceeu.cz with AJAX pagination support
 
 import asyncio
 import csv
-import json
+import hashlib
 import logging
+import multiprocessing
 import os
 import re
 import sys
 import random
-from dataclasses import dataclass, asdict
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional, List, Dict
 from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
+import orjson
 import yaml
-from bs4 import BeautifulSoup
-from playwright.async_api import async_playwright, Page, Browser
-from dateutil import parser as date_parser
+from playwright.async_api import async_playwright, Page
 
 # Sub-scraper imports
-from subscrapers import SubScraperRegistry, GrantContent, Document
+from subscrapers import SubScraperRegistry, Document
 from subscrapers.opst_cz import OPSTCzScraper
 from subscrapers.mv_gov_cz import MVGovCzScraper
 from subscrapers.nrb_cz import NRBCzScraper
@@ -37,7 +38,21 @@ from subscrapers.esfcr_cz import ESFCRCzScraper
 from subscrapers.opzp_cz import OPZPCzScraper
 from subscrapers.optak_gov_cz import OPTAKGovCzScraper
 from subscrapers.sfzp_cz import SFZPCzScraper
-from subscrapers.utils import download_document, convert_document_to_markdown
+from subscrapers.utils import convert_document_to_markdown
+
+# Detail page parsing (importable by process-pool workers)
+from dotaceeu_parser import DotaceuGrant, parse_grant_detail, IROP_CALL_NUMBER_RE, CALL_NUMBER_RE
+
+
+# libyaml-backed loader when PyYAML was built with it, pure-Python otherwise
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+ENV_VAR_RE = re.compile(r'\$\{([^}]+?)(?::-([^}]*))?\}')  # ${VAR_NAME} or ${VAR_NAME:-default}
+
+
+def _replace_env(match: re.Match) -> str:
+    """Resolve one ${VAR_NAME:-default} reference from the environment"""
+    var_name, default = match.groups()
+    return os.getenv(var_name, default or '')
 
 
 def load_config(config_path: str = "config.yml") -> Dict:
@@ -46,16 +61,8 @@ def load_config(config_path: str = "config.yml") -> Dict:
         config_text = f.read()
 
     # Substitute environment variables: ${VAR_NAME:-default}
-    def replace_env(match):
-        var_expr = match.group(1)
-        if ':-' in var_expr:
-            var_name, default = var_expr.split(':-', 1)
-            return os.getenv(var_name, default)
-        else:
-            return os.getenv(var_expr, '')
-
-    config_text = re.sub(r'\$\{([^}]+)\}', replace_env, config_text)
-    return yaml.safe_load(config_text)
+    config_text = ENV_VAR_RE.sub(_replace_env, config_text)
+    return yaml.load(config_text, Loader=YAML_LOADER)
 
 
 def setup_logging(config: Dict):
@@ -76,394 +83,21 @@ def setup_logging(config: Dict):
 
 
 # ============================================================================
-# SECTION 2: Data Models
-# ============================================================================
-
-@dataclass
-class DotaceuGrant:
-    """
-    Represents a grant from dotaceeu.cz
-
-    Handles two page types:
-    - Type A (Czech OPs): Full metadata including call_number, eligible_applicants
-    - Type B (EU direct): Simplified metadata, missing some fields
-    """
-
-    # Identifiers
-    external_id: str              # Call number OR URL slug (if no call number)
-    source_url: str               # Detail page URL
-
-    # Core metadata
-    call_number: Optional[str]            # Číslo výzvy (Type A only)
-    title: str
-    operational_programme: Optional[str]  # Operační program
-    programming_period: Optional[str]     # Programové období
-    priority_axis: Optional[str]          # Prioritní osa
-
-    # Call details
-    call_type: Optional[str]              # Průběžná/Kolová
-    call_status: Optional[str]            # Otevřená/Uzavřená/Plánovaná
-    eligible_applicants: Optional[str]    # Oprávnění žadatelé (Type A only - raw text)
-
-    # Dates (CRITICAL)
-    application_availability: Optional[datetime]  # Zpřístupnění žádosti o podporu
-    application_start: Optional[datetime]         # Zahájení příjmu
-    submission_deadline: Optional[datetime]       # Ukončení příjmu
-
-    # Funding
-    min_amount: Optional[float]           # Min support amount (from text parsing)
-    max_amount: Optional[float]           # Max support amount (from text parsing)
-    total_allocation: Optional[float]     # Total allocation if mentioned
-
-    # Content
-    description: Optional[str]
-    attached_documents: List[dict]        # [{url, title, type}] - empty in v1
-    application_link: Optional[str]       # Více informací na
-    all_urls: List[str]                   # All URLs found in grant text
-
-    # Computed fields
-    is_ngo_eligible: bool                     # Derived from eligible_applicants
-    page_type: str                            # "type_a" or "type_b"
-
-    # Metadata
-    scraped_at: datetime
-
-    def to_dict(self):
-        """Convert to dictionary for JSON serialization"""
-        return {
-            k: v.isoformat() if isinstance(v, datetime) else v
-            for k, v in asdict(self).items()
-        }
-
-    def to_grantio_format(self) -> dict:
-        """Convert to GrantSource-compatible JSON format"""
-        return {
-            "ExternalId": self.external_id,
-            "Title": self.title,
-            "WebSite": self.source_url,
-            "Data": json.dumps(self.to_dict()),
-        }
-
-
-# ============================================================================
-# SECTION 3: Utility Functions
-# ============================================================================
-
-def parse_czech_date(text: str) -> Optional[datetime]:
-    """
-    Parse Czech date format: '9. 1. 2026' or '30. 4. 2026'
-
-    Returns datetime object or None if parsing fails
-    """
-    if not text:
-        return None
-
-    # Pattern: day. month. year
-    pattern = r'(\d{1,2})\.\s*(\d{1,2})\.\s*(\d{4})'
-    match = re.search(pattern, text)
-
-    if match:
-        day, month, year = match.groups()
-        try:
-            return datetime(int(year), int(month), int(day))
-        except ValueError as e:
-            logging.warning(f"Invalid date: {text} - {e}")
-            return None
-
-    return None
-
-
-def is_ngo_eligible(text: str, keywords: List[str]) -> bool:
-    """
-    Check if eligible_applicants text contains NGO keywords
-
-    Keywords from validation: nadace, spolky, obecně prospěšné, etc.
-    """
-    if not text:
-        return False
-
-    text_lower = text.lower()
-    return any(keyword.lower() in text_lower for keyword in keywords)
-
-
-def generate_external_id(call_number: Optional[str], url: str) -> str:
-    """
-    Generate external_id: use call number if available, else URL slug
-
-    For Type B pages without call numbers, we prefix with 'slug_'
-    """
-    if call_number:
-        return call_number
-
-    # Fallback: extract URL slug
-    slug = url.rstrip('/').split('/')[-1]
-    return f"slug_{slug}"
-
-
-# ============================================================================
-# SECTION 4: HTML Parser
+# SECTION 2: Crawler
 # ============================================================================
 
-def parse_grant_detail(html: str, url: str, config: Dict) -> Optional[DotaceuGrant]:
-    """
-    Parse grant detail page HTML into DotaceuGrant object
-
-    Handles both Type A (full metadata) and Type B (simplified) pages
-    """
-    soup = BeautifulSoup(html, 'html.parser')
-
-    # Extract metadata fields
-    info = extract_metadata_fields(soup)
-
-    # Determine page type
-    page_type = determine_page_type(info)
-
-    # Extract title from h1
-    title_elem = soup.find('h1')
-    title = title_elem.get_text(strip=True) if title_elem else "Untitled"
-
-    # Generate external ID
-    call_number = info.get("Číslo výzvy")
-    external_id = generate_external_id(call_number, url)
-
-    # Check NGO eligibility
-    eligible_text = info.get("Oprávnění žadatelé", "")
-    ngo_eligible = is_ngo_eligible(eligible_text, config['filters']['ngo_keywords'])
-
-    # Extract all URLs from page
-    base_url = config['scraper']['base_url']
-    all_urls = extract_all_urls(soup, base_url)
-
-    # Extract funding amounts from text
-    page_text = soup.get_text()
-    min_amt, max_amt, total_alloc = extract_funding_amounts(page_text)
-
-    grant = DotaceuGrant(
-        external_id=external_id,
-        source_url=url,
-        call_number=call_number,
-        title=title,
-        operational_programme=info.get("Operační program"),
-        programming_period=info.get("Programové období"),
-        priority_axis=info.get("Prioritní osa"),
-        call_type=info.get("Druh výzvy"),
-        call_status=info.get("Stav výzvy"),
-        eligible_applicants=eligible_text if eligible_text else None,
-        application_availability=parse_czech_date(info.get("Zpřístupnění žádosti o podporu", "")),
-        application_start=parse_czech_date(info.get("Zahájení příjmu žádostí", "")),
-        submission_deadline=parse_czech_date(info.get("Ukončení příjmu žádostí", "")),
-        min_amount=min_amt,
-        max_amount=max_amt,
-        total_allocation=total_alloc,
-        description=None,  # Not available in current structure
-        attached_documents=[],  # PDFs use JS PostBack - skip in v1
-        application_link=info.get("Více informací na"),
-        all_urls=all_urls,
-        is_ngo_eligible=ngo_eligible,
-        page_type=page_type,
-        scraped_at=datetime.now(timezone.utc),
-    )
-
-    return grant
-
-
-def extract_metadata_fields(soup: BeautifulSoup) -> Dict[str, str]:
-    """
-    Extract metadata label-value pairs from page text
-
-    dotaceeu.cz uses plain text labels with values in <strong> tags,
-    NOT HTML tables as originally assumed
-    """
-    info = {}
-
-    # Get all text content
-    text = soup.get_text()
-
-    # Define fields to extract (from validation)
-    fields = [
-        "Číslo výzvy",
-        "Druh výzvy",
-        "Operační program",
-        "Prioritní osa",
-        "Oprávnění žadatelé",
-        "Zahájení příjmu žádostí",
-        "Ukončení příjmu žádostí",
-        "Stav výzvy",
-        "Programové období",
-        "Zpřístupnění žádosti o podporu",
-        "Více informací na",
-    ]
-
-    # Extract each field using regex
-    for field in fields:
-        # Pattern: "Field name:\s*\n*\s*(value)"
-        pattern = rf"{re.escape(field)}:\s*\n?\s*([^\n]+)"
-        match = re.search(pattern, text, re.MULTILINE)
-
-        if match:
-            value = match.group(1).strip()
-            # Remove any remaining markup artifacts
-            value = re.sub(r'\*\*|<[^>]+>', '', value)
-            info[field] = value
-
-    return info
-
-
-def determine_page_type(info: Dict[str, str]) -> str:
-    """
-    Determine if page is Type A (full metadata) or Type B (simplified)
-
-    Type A: Czech OPs with call_number and eligible_applicants
-    Type B: EU direct programs without these fields
-    """
-    has_call_number = "Číslo výzvy" in info
-    has_eligible_applicants = "Oprávnění žadatelé" in info
-
-    if has_call_number and has_eligible_applicants:
-        return "type_a"
-    else:
-        return "type_b"
-
-
-def extract_all_urls(soup: BeautifulSoup, base_url: str) -> List[str]:
-    """
-    Extract all absolute URLs from grant page
-
-    Returns deduplicated list of URLs found in links
-    """
-    urls = []
-
-    for link in soup.find_all('a', href=True):
-        href = link['href']
-
-        # Convert to absolute URL
-        if href.startswith('http://') or href.startswith('https://'):
-            urls.append(href)
-        elif href.startswith('/'):
-            urls.append(base_url + href)
-        elif href.startswith('#'):
-            # Skip anchor links
-            continue
-        elif href.startswith('javascript:'):
-            # Skip javascript links
-            continue
-        else:
-            # Relative URL
-            urls.append(base_url + '/' + href)
-
-    # Deduplicate while preserving order
-    seen = set()
-    deduplicated = []
-    for url in urls:
-        if url not in seen:
-            seen.add(url)
-            deduplicated.append(url)
-
-    return deduplicated
-
-
-def extract_funding_amounts(text: str) -> tuple:
-    """
-    Extract min/max/total funding amounts from Czech text
-
-    Handles formats like:
-    - "500 mil. Kč" = 500 000 000
-    - "10 000 000 Kč" = 10 000 000
-    - "5,5 mil. Kč" = 5 500 000
-    - "minimální částka: X"
-    - "maximální částka: X"
-    - "celková alokace: X"
-
-    Returns: (min_amount, max_amount, total_allocation) in CZK
-    """
-    min_amt = None
-    max_amt = None
-    total_alloc = None
-
-    if not text:
-        return (min_amt, max_amt, total_alloc)
-
-    def parse_amount(amount_str: str) -> Optional[float]:
-        """Parse Czech currency format to float"""
-        if not amount_str:
-            return None
-
-        # Remove spaces and common separators
-        amount_str = amount_str.strip()
-
-        # Handle millions (mil. or miliónů)
-        if 'mil' in amount_str.lower():
-            # Extract number before "mil"
-            match = re.search(r'([\d\s,\.]+)\s*mil', amount_str, re.IGNORECASE)
-            if match:
-                num_str = match.group(1).replace(' ', '').replace(',', '.')
-                try:
-                    return float(num_str) * 1_000_000
-                except ValueError:
-                    return None
-
-        # Handle billions (mld. or miliard)
-        if 'mld' in amount_str.lower() or 'miliard' in amount_str.lower():
-            match = re.search(r'([\d\s,\.]+)\s*mld', amount_str, re.IGNORECASE)
-            if match:
-                num_str = match.group(1).replace(' ', '').replace(',', '.')
-                try:
-                    return float(num_str) * 1_000_000_000
-                except ValueError:
-                    return None
-
-        # Handle plain numbers with spaces (e.g., "10 000 000")
-        match = re.search(r'([\d\s]+)\s*Kč', amount_str)
-        if match:
-            num_str = match.group(1).replace(' ', '')
-            try:
-                return float(num_str)
-            except ValueError:
-                return None
-
-        return None
-
-    # Search for minimum amount
-    min_patterns = [
-        r'minim[aá]ln[íi]\s+[čc][aá]stka[:\s]+([^\n]+?)(?:Kč|$)',
-        r'minimum[:\s]+([^\n]+?)(?:Kč|$)',
-        r'od\s+([^\n]+?)\s+Kč',
-    ]
-    for pattern in min_patterns:
-        match = re.search(pattern, text, re.IGNORECASE | re.MULTILINE)
-        if match and not min_amt:
-            min_amt = parse_amount(match.group(1))
-
-    # Search for maximum amount
-    max_patterns = [
-        r'maxim[aá]ln[íi]\s+[čc][aá]stka[:\s]+([^\n]+?)(?:Kč|$)',
-        r'maximum[:\s]+([^\n]+?)(?:Kč|$)',
-        r'do\s+([^\n]+?)\s+Kč',
-        r'až\s+([^\n]+?)\s+Kč',
-    ]
-    for pattern in max_patterns:
-        match = re.search(pattern, text, re.IGNORECASE | re.MULTILINE)
-        if match and not max_amt:
-            max_amt = parse_amount(match.group(1))
-
-    # Search for total allocation
-    alloc_patterns = [
-        r'celkov[aá]\s+alokace[:\s]+([^\n]+?)(?:Kč|$)',
-        r'alokace[:\s]+([^\n]+?)(?:Kč|$)',
-        r'rozpočet[:\s]+([^\n]+?)(?:Kč|$)',
-        r'celkov[yý]\s+rozpočet[:\s]+([^\n]+?)(?:Kč|$)',
-    ]
-    for pattern in alloc_patterns:
-        match = re.search(pattern, text, re.IGNORECASE | re.MULTILINE)
-        if match and not total_alloc:
-            total_alloc = parse_amount(match.group(1))
-
-    return (min_amt, max_amt, total_alloc)
-
+# Collect (title, href) for every listing item inside the page in one call
+LISTING_ITEMS_JS = """
+elements => elements.map(el => {
+    const title = el.querySelector('h3');
+    const link = el.querySelector('a:has(h3)');
+    return {
+        title: title ? title.textContent : null,
+        href: link ? link.getAttribute('href') : null,
+    };
+})
+"""
 
-# ============================================================================
-# SECTION 5: Crawler
-# ============================================================================
 
 class DotaceuCrawler:
     """Main crawler class for dotaceeu.cz"""
@@ -475,6 +109,15 @@ class DotaceuCrawler:
         self.processed_count = 0
         self.error_count = 0
         self.deep_scrape = deep_scrape
+        self.parse_executor = None  # Process pool for CPU-bound detail parsing (set in run)
+        self.deep_scrape_semaphore = None  # Caps concurrent deep scrapes (set on first use)
+        self.deep_scrape_tasks = []
+        self.skipped_count = 0
+        self.browser = None
+        self.browser_lock = asyncio.Lock()  # Serializes browser relaunch across detail workers
+        self.run_started_at = None  # Shared scraped_at for every record of a run (set in run)
+        self.state_mgr = None  # Loaded once in run when resume is enabled; reused by main to save
+        self.ngo_keywords = tuple(config['filters']['ngo_keywords'])  # Hashable; sent to parse workers
 
         # Initialize sub-scraper registry
         self.scraper_registry = None
@@ -494,17 +137,27 @@ class DotaceuCrawler:
     async def run(self, max_grants: Optional[int] = None):
         """Main scraping orchestration"""
         self.logger.info("Starting dotaceeu.cz scraper")
+        self.run_started_at = datetime.now(timezone.utc)
 
         # Load state for resumability
         state_mgr = None
         if self.config['resume']['enabled']:
-            state_mgr = StateManager(self.config)
-            self.logger.info(f"Resume enabled. Already processed: {len(state_mgr.state.get('processed_ids', []))} grants")
+            state_mgr = self.state_mgr = StateManager(self.config)
+            self.logger.info(f"Resume enabled. Already processed: {len(state_mgr.processed_ids)} grants")
+
+        # HTML parsing is CPU-bound; keep it off the event loop (0 = one worker per CPU).
+        # Workers start lazily on first submit, which is after Playwright has
+        # started its threads, so spawn them fresh rather than forking this process
+        parse_workers = int(self.config['parsing']['workers']) or None
+        self.parse_executor = ProcessPoolExecutor(
+            max_workers=parse_workers,
+            mp_context=multiprocessing.get_context('spawn'),
+        )
 
         async with async_playwright() as p:
             self.playwright = p  # Store for browser recovery
-            browser = await self.launch_browser(p)
-            page = await browser.new_page()
+            self.browser = await self.launch_browser(p)
+            page = await self.browser.new_page()
 
             try:
                 # Step 1: Navigate to listing page
@@ -519,10 +172,10 @@ class DotaceuCrawler:
                         await asyncio.sleep(self.add_jitter(2000))
 
                         # Step 2: Load all pages via AJAX pagination
-                        await self.load_all_pages(page)
+                        await self.load_all_pages(page, max_items=max_grants)
 
                         # Step 3: Extract grant items from listing
-                        grant_items = await self.extract_grant_items(page)
+                        grant_items = await self.extract_grant_items(page, limit=max_grants)
                         self.logger.info(f"Found {len(grant_items)} grants in listing")
                         break  # Success
 
@@ -534,13 +187,13 @@ class DotaceuCrawler:
 
                                 # Close old browser
                                 try:
-                                    await browser.close()
+                                    await self.browser.close()
                                 except:
                                     pass
 
                                 # Create new browser and page
-                                browser = await self.launch_browser(self.playwright)
-                                page = await browser.new_page()
+                                self.browser = await self.launch_browser(self.playwright)
+                                page = await self.browser.new_page()
                                 self.logger.info("Browser recovered successfully")
                                 await asyncio.sleep(2)
                             else:
@@ -549,81 +202,127 @@ class DotaceuCrawler:
                         else:
                             raise
 
-                # Apply max_grants limit to items to process
                 if max_grants:
-                    grant_items = grant_items[:max_grants]
                     self.logger.info(f"Limiting to first {max_grants} grants")
 
-                # Step 4: Process each grant detail page
-                skipped_count = 0
-                for i, item in enumerate(grant_items, 1):
-                    self.logger.info(f"Processing grant {i}/{len(grant_items)}: {item['title'][:50]}...")
+                # Step 4: Process grant detail pages on a small pool of browser tabs
+                detail_concurrency = int(self.config['scraper']['detail_concurrency'])
+                page_pool = asyncio.Queue()
+                page_pool.put_nowait(page)
+                for _ in range(detail_concurrency - 1):
+                    page_pool.put_nowait(await self.browser.new_page())
 
-                    # Attempt to process grant with browser recovery
-                    max_browser_retries = 2
-                    grant = None
+                self.logger.info(f"Scraping {len(grant_items)} detail pages (concurrency: {detail_concurrency})")
+                await asyncio.gather(*(
+                    self.process_grant_item(i, len(grant_items), item, page_pool, state_mgr)
+                    for i, item in enumerate(grant_items, 1)
+                ))
 
-                    for retry in range(max_browser_retries):
-                        try:
-                            grant = await self.scrape_grant_detail(page, item)
+                # Keep listing order regardless of completion order
+                listing_order = {item['url']: i for i, item in enumerate(grant_items)}
+                self.grants.sort(key=lambda g: listing_order.get(g.source_url, len(listing_order)))
 
-                            if grant:
-                                # Check if already processed
-                                if state_mgr and state_mgr.is_processed(grant.external_id):
-                                    self.logger.info(f"Skipping {grant.external_id} (already processed)")
-                                    skipped_count += 1
-                                    break
+                # Step 5: Wait for deep scrapes still in flight
+                if self.deep_scrape_tasks:
+                    pending = sum(1 for task in self.deep_scrape_tasks if not task.done())
+                    self.logger.info(f"Waiting for {pending}/{len(self.deep_scrape_tasks)} deep scrapes to finish")
+                    await asyncio.gather(*self.deep_scrape_tasks)
+                    self.logger.info(f"Deep scrape complete. Unchanged pages served from HTTP cache: {self.scraper_registry.cache_hits()}")
 
-                                # Deep scrape external sources if enabled
-                                if self.deep_scrape and self.scraper_registry:
-                                    await self.deep_scrape_grant(grant)
+                self.logger.info(f"Scraping complete. Processed: {self.processed_count}, Errors: {self.error_count}, Skipped: {self.skipped_count}")
 
-                                self.grants.append(grant)
-                                self.processed_count += 1
-                            else:
-                                self.error_count += 1
-
-                            break  # Success, exit retry loop
-
-                        except Exception as e:
-                            error_msg = str(e)
-
-                            # Check if browser/page crashed
-                            if 'target' in error_msg.lower() and 'closed' in error_msg.lower():
-                                if retry < max_browser_retries - 1:
-                                    self.logger.warning(f"Browser crashed, attempting recovery (retry {retry + 1}/{max_browser_retries})")
-
-                                    # Close old browser if possible
-                                    try:
-                                        await browser.close()
-                                    except:
-                                        pass
-
-                                    # Create new browser and page
-                                    browser = await self.launch_browser(self.playwright)
-                                    page = await browser.new_page()
-                                    self.logger.info("Browser recovered successfully")
-
-                                    # Wait before retry
-                                    await asyncio.sleep(2)
-                                else:
-                                    self.logger.error(f"Failed to recover browser after {max_browser_retries} attempts")
-                                    self.error_count += 1
-                                    break
-                            else:
-                                # Non-browser error, log and continue
-                                self.logger.error(f"Error processing grant: {e}")
-                                self.error_count += 1
-                                break
+            finally:
+                await self.browser.close()
+                executor, self.parse_executor = self.parse_executor, None
+                if executor:
+                    # Wait for the workers off the event loop
+                    await asyncio.to_thread(executor.shutdown, True, cancel_futures=True)
+
+    async def process_grant_item(self, index: int, total: int, item: Dict,
+                                 page_pool: asyncio.Queue, state_mgr: Optional['StateManager']):
+        """Scrape one listing item on a pooled page, recovering from browser crashes"""
+        page = await page_pool.get()
+        try:
+            self.logger.info(f"Processing grant {index}/{total}: {item['title'][:50]}...")
 
-                    # Delay between items with random jitter
-                    delay_ms = int(self.config['delays']['between_items'])
-                    await asyncio.sleep(self.add_jitter(delay_ms))
+            # Attempt to process grant with browser recovery
+            max_browser_retries = 2
+            grant = None
 
-                self.logger.info(f"Scraping complete. Processed: {self.processed_count}, Errors: {self.error_count}, Skipped: {skipped_count}")
+            for retry in range(max_browser_retries):
+                try:
+                    grant = await self.scrape_grant_detail(page, item)
 
-            finally:
-                await browser.close()
+                    if grant:
+                        # Check if already processed
+                        if state_mgr and state_mgr.is_processed(grant.external_id):
+                            self.logger.info(f"Skipping {grant.external_id} (already processed)")
+                            self.skipped_count += 1
+                            break
+
+                        self.grants.append(grant)
+                        self.processed_count += 1
+
+                        # Deep scrape in the background while crawling continues
+                        if self.deep_scrape and self.scraper_registry:
+                            self.deep_scrape_tasks.append(self.start_deep_scrape(grant))
+                    else:
+                        self.error_count += 1
+
+                    break  # Success, exit retry loop
+
+                except Exception as e:
+                    error_msg = str(e)
+
+                    # Check if browser/page crashed
+                    if 'target' in error_msg.lower() and 'closed' in error_msg.lower():
+                        if retry < max_browser_retries - 1:
+                            self.logger.warning(f"Browser crashed, attempting recovery (retry {retry + 1}/{max_browser_retries})")
+                            # Close the crashed page so it does not leak
+                            try:
+                                await page.close()
+                            except Exception:
+                                pass
+                            page = await self.recover_page()
+
+                            # Wait before retry
+                            await asyncio.sleep(2)
+                        else:
+                            self.logger.error(f"Failed to recover browser after {max_browser_retries} attempts")
+                            self.error_count += 1
+                            break
+                    else:
+                        # Non-browser error, log and continue
+                        self.logger.error(f"Error processing grant: {e}")
+                        self.error_count += 1
+                        break
+
+            # Delay between items with random jitter (per tab)
+            delay_ms = int(self.config['delays']['between_items'])
+            await asyncio.sleep(self.add_jitter(delay_ms))
+
+        finally:
+            page_pool.put_nowait(page)
+
+    async def recover_page(self) -> Page:
+        """
+        Return a fresh page, relaunching the browser if it has died.
+
+        Several detail workers may hit the same crash; the lock ensures the
+        browser is relaunched only once.
+        """
+        async with self.browser_lock:
+            if not self.browser.is_connected():
+                # Close old browser if possible
+                try:
+                    await self.browser.close()
+                except Exception:
+                    pass
+
+                self.browser = await self.launch_browser(self.playwright)
+                self.logger.info("Browser recovered successfully")
+
+            return await self.browser.new_page()
 
     async def launch_browser(self, playwright):
         """Launch Chromium browser with stealth configuration"""
@@ -645,8 +344,12 @@ class DotaceuCrawler:
         jitter = random.uniform(-0.2, 0.2)
         return (delay_ms * (1 + jitter)) / 1000
 
-    async def load_all_pages(self, page: Page):
-        """Click 'Load more' button until no more pages"""
+    async def load_all_pages(self, page: Page, max_items: Optional[int] = None):
+        """
+        Click 'Load more' button until no more pages
+
+        Stops early once at least max_items items are loaded (if given)
+        """
         click_count = 0
         max_clicks = 50  # Safety limit
 
@@ -666,6 +369,9 @@ class DotaceuCrawler:
 
                 # Count items before click
                 items_before = await page.locator(item_selector).count()
+                if max_items and items_before >= max_items:
+                    self.logger.info(f"Loaded {items_before} items, enough for limit of {max_items}")
+                    break
 
                 # Click and wait for new content
                 await load_more.click()
@@ -693,23 +399,22 @@ class DotaceuCrawler:
         if click_count >= max_clicks:
             self.logger.warning(f"Reached max pagination clicks ({max_clicks})")
 
-    async def extract_grant_items(self, page: Page) -> List[Dict]:
-        """Extract all grant items from loaded listing"""
+    async def extract_grant_items(self, page: Page, limit: Optional[int] = None) -> List[Dict]:
+        """Extract grant items from loaded listing, stopping after limit items (if given)"""
         items = page.locator(self.config['selectors']['ajax_item'])
-        count = await items.count()
 
-        grants = []
-        for i in range(count):
-            item = items.nth(i)
+        # Read title + link for all items in one browser round-trip instead of
+        # several locator calls per item. The link is the one that wraps the
+        # h3, not tag links.
+        raw_items = await items.evaluate_all(LISTING_ITEMS_JS)
 
-            # Extract title
-            title_elem = item.locator("h3")
-            title_text = await title_elem.text_content()
+        grants = []
+        for raw in raw_items:
+            if limit and len(grants) >= limit:
+                break
 
-            # Extract link - the one that wraps the h3, not tag links
-            # Use :has(h3) selector to get the right link
-            link_elem = item.locator("a:has(h3)")
-            href = await link_elem.get_attribute("href")
+            href = raw.get('href')
+            title_text = raw.get('title')
 
             if href and title_text:
                 full_url = self.make_absolute_url(href)
@@ -726,8 +431,23 @@ class DotaceuCrawler:
             # Navigate with retry
             html = await self.retry_navigation(page, item['url'])
 
-            # Parse HTML into DotaceuGrant
-            grant = parse_grant_detail(html, item['url'], self.config)
+            # Parse HTML into DotaceuGrant (in the process pool when running)
+            parse_args = (html, item['url'], self.config['scraper']['base_url'],
+                          self.ngo_keywords, self.run_started_at)
+            executor = self.parse_executor
+            if executor:
+                loop = asyncio.get_running_loop()
+                try:
+                    grant = await loop.run_in_executor(executor, parse_grant_detail, *parse_args)
+                except BrokenProcessPool:
+                    # A worker died (OOM kill, segfault); parse in-process for the rest of the run
+                    if self.parse_executor is executor:
+                        self.logger.warning("Parse worker pool is broken, parsing in-process from now on")
+                        self.parse_executor = None
+                        executor.shutdown(wait=False, cancel_futures=True)
+                    grant = parse_grant_detail(*parse_args)
+            else:
+                grant = parse_grant_detail(*parse_args)
 
             return grant
 
@@ -761,6 +481,24 @@ class DotaceuCrawler:
 
         raise Exception(f"Failed to navigate to {url} after {max_retries} attempts")
 
+    def start_deep_scrape(self, grant: DotaceuGrant) -> asyncio.Task:
+        """
+        Schedule deep scraping of a grant in the background.
+
+        Sub-scraper fetches are network-bound, so they run while the crawler
+        keeps walking detail pages; a semaphore caps in-flight deep scrapes.
+        """
+        if self.deep_scrape_semaphore is None:
+            concurrency = int(self.config['deep_scrape']['concurrency'])
+            self.deep_scrape_semaphore = asyncio.Semaphore(concurrency)
+            self.logger.info(f"Deep scraping grants as they are found (concurrency: {concurrency})")
+
+        async def bounded_deep_scrape():
+            async with self.deep_scrape_semaphore:
+                await self.deep_scrape_grant(grant)
+
+        return asyncio.create_task(bounded_deep_scrape())
+
     async def deep_scrape_grant(self, grant: DotaceuGrant):
         """
         Deep scrape external sources for grant content.
@@ -789,8 +527,7 @@ class DotaceuCrawler:
         # Strategy 1b: IROP URL construction
         if not scraper and grant.operational_programme and 'Integrovaný regionální' in grant.operational_programme:
             # Extract call number from title (e.g., "118. výzva IROP" → "118")
-            import re
-            match = re.search(r'(\d+)\.\s*výzva\s+IROP', grant.title, re.IGNORECASE)
+            match = IROP_CALL_NUMBER_RE.search(grant.title)
             if match:
                 call_num = match.group(1)
                 constructed_url = f"https://irop.gov.cz/Vyzvy-2021-2027/Vyzvy/{call_num}vyzvaIROP"
@@ -803,8 +540,7 @@ class DotaceuCrawler:
         # Strategy 1c: OPZP URL construction
         if not scraper and grant.operational_programme and 'Životní prostředí' in grant.operational_programme:
             # Extract call number from title (e.g., "MŽP_98. výzva" → "98")
-            import re
-            match = re.search(r'(\d+)\.\s*výzva', grant.title, re.IGNORECASE)
+            match = CALL_NUMBER_RE.search(grant.title)
             if match:
                 call_num = match.group(1)
                 constructed_url = f"https://opzp.cz/dotace/{call_num}-vyzva/"
@@ -834,6 +570,7 @@ class DotaceuCrawler:
                 'title': grant.title,
                 'call_number': grant.call_number,
                 'external_id': grant.external_id,
+                'scraped_at': grant.scraped_at,
             }
 
             content = await scraper.extract_content(target_url, grant_metadata)
@@ -841,62 +578,99 @@ class DotaceuCrawler:
                 self.logger.warning(f"Failed to extract content from {target_url}")
                 return
 
+            # Pages often link the same file more than once (icon + title);
+            # deduplicate by URL so each document is downloaded and converted once
+            seen_urls = set()
+            unique_documents = []
+            for doc in content.documents:
+                if doc.url not in seen_urls:
+                    seen_urls.add(doc.url)
+                    unique_documents.append(doc)
+            content.documents = unique_documents
+
             # Create document directory
             doc_dir = Path(self.config['output']['path']).parent / 'documents' / grant.external_id
             doc_dir.mkdir(parents=True, exist_ok=True)
 
-            # Download and convert documents
-            converted_count = 0
-            for doc in content.documents:
-                try:
-                    # Determine local filename
-                    filename = f"{doc.doc_type}_{Path(doc.url).name}"
-                    local_path = doc_dir / filename
-
-                    # Download document
-                    success = await scraper.download_document(doc.url, str(local_path))
-                    if not success:
-                        self.logger.warning(f"Failed to download {doc.url}")
-                        continue
-
-                    doc.local_path = str(local_path)
-
-                    # Convert to markdown
-                    if doc.file_format in ['pdf', 'xlsx', 'xlsm', 'docx']:
-                        markdown = convert_document_to_markdown(str(local_path))
-
-                        if markdown:
-                            # Save markdown
-                            markdown_filename = local_path.stem + '.md'
-                            markdown_path = doc_dir / markdown_filename
+            # Download and convert documents concurrently
+            semaphore = asyncio.Semaphore(int(self.config['deep_scrape']['document_concurrency']))
 
-                            with open(markdown_path, 'w', encoding='utf-8') as f:
-                                f.write(markdown)
+            async def bounded_process_document(doc: Document) -> bool:
+                async with semaphore:
+                    return await self.process_document(scraper, doc, doc_dir)
 
-                            doc.markdown_path = str(markdown_path)
-                            doc.markdown_content = markdown[:500] + '...' if len(markdown) > 500 else markdown  # Store preview
-                            doc.conversion_method = doc.file_format
-                            converted_count += 1
-
-                            self.logger.debug(f"Converted {doc.title} to markdown ({len(markdown)} chars)")
-
-                except Exception as e:
-                    self.logger.error(f"Error processing document {doc.url}: {e}")
-                    continue
+            results = await asyncio.gather(*(bounded_process_document(doc) for doc in content.documents))
+            converted_count = sum(results)
 
             # Save GrantContent as JSON
             deep_dir = Path(self.config['output']['path']).parent / 'deep'
             deep_dir.mkdir(parents=True, exist_ok=True)
             content_file = deep_dir / f"{grant.external_id}.json"
 
-            with open(content_file, 'w', encoding='utf-8') as f:
-                json.dump(content.to_dict(), f, ensure_ascii=False, indent=2)
+            content_file.write_bytes(orjson.dumps(content.to_dict(), option=orjson.OPT_INDENT_2))
 
             self.logger.info(f"Deep scrape complete for {grant.external_id}: {len(content.documents)} documents, {converted_count} converted to markdown")
 
         except Exception as e:
             self.logger.error(f"Error during deep scrape of {grant.external_id}: {e}", exc_info=True)
 
+    async def process_document(self, scraper, doc: Document, doc_dir: Path) -> bool:
+        """
+        Download a single document and convert it to markdown.
+
+        Updates doc in place with local/markdown paths.
+
+        Returns:
+            True if the document was converted to markdown
+        """
+        try:
+            # Determine local filename. Documents download concurrently, and
+            # different URLs can share a basename (.../2023/priloha.pdf and
+            # .../2024/priloha.pdf), so a short URL hash keeps targets distinct
+            url_key = hashlib.blake2b(doc.url.encode('utf-8'), digest_size=4).hexdigest()
+            filename = f"{doc.doc_type}_{url_key}_{Path(doc.url).name}"
+            local_path = doc_dir / filename
+
+            # Download document
+            success = await scraper.download_document(doc.url, str(local_path))
+            if not success:
+                self.logger.warning(f"Failed to download {doc.url}")
+                return False
+
+            doc.local_path = str(local_path)
+
+            if doc.file_format in ['pdf', 'xlsx', 'xlsm', 'docx']:
+                markdown_filename = local_path.stem + '.md'
+                markdown_path = doc_dir / markdown_filename
+
+                # Reuse markdown from an earlier run if the document has not
+                # been re-downloaded since (unchanged files answer 304)
+                if (markdown_path.exists()
+                        and markdown_path.stat().st_mtime_ns >= local_path.stat().st_mtime_ns):
+                    markdown = markdown_path.read_text(encoding='utf-8')
+                    self.logger.debug(f"Reusing converted markdown for {doc.title}")
+                else:
+                    # Convert in a worker thread so other downloads keep flowing
+                    markdown = await asyncio.to_thread(convert_document_to_markdown, str(local_path))
+
+                    if markdown:
+                        # Save markdown
+                        with open(markdown_path, 'w', encoding='utf-8') as f:
+                            f.write(markdown)
+
+                if markdown:
+                    doc.markdown_path = str(markdown_path)
+                    doc.markdown_content = markdown[:500] + '...' if len(markdown) > 500 else markdown  # Store preview
+                    doc.conversion_method = doc.file_format
+
+                    self.logger.debug(f"Converted {doc.title} to markdown ({len(markdown)} chars)")
+                    return True
+
+        except Exception as e:
+            self.logger.error(f"Error processing document {doc.url}: {e}")
+
+        return False
+
     def make_absolute_url(self, href: str) -> str:
         """Convert relative URL to absolute"""
         base_url = self.config['scraper']['base_url']
@@ -910,7 +684,7 @@ class DotaceuCrawler:
 
 
 # ============================================================================
-# SECTION 6: Storage + State Management
+# SECTION 3: Storage + State Management
 # ============================================================================
 
 class StorageManager:
@@ -920,27 +694,28 @@ class StorageManager:
         self.config = config
         self.output_dir = Path(config['output']['path'])
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        # One timestamp per run so the JSON and CSV files of a run pair up
+        self.timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         self.logger = logging.getLogger(__name__)
 
     def save_json(self, grants: List[DotaceuGrant]) -> str:
         """Save grants as JSON (Grantio import format)"""
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filename = f"dotaceeu_grants_{timestamp}.json"
+        filename = f"dotaceeu_grants_{self.timestamp}.json"
         filepath = self.output_dir / filename
 
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(
+        # orjson encodes in C straight to UTF-8 bytes (same layout as indent=2)
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(
                 [g.to_grantio_format() for g in grants],
-                f, ensure_ascii=False, indent=2
-            )
+                option=orjson.OPT_INDENT_2
+            ))
 
         self.logger.info(f"Saved JSON: {filepath} ({len(grants)} grants)")
         return str(filepath)
 
     def save_csv(self, grants: List[DotaceuGrant]) -> str:
         """Save grants as CSV (human review)"""
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filename = f"dotaceeu_grants_{timestamp}.csv"
+        filename = f"dotaceeu_grants_{self.timestamp}.csv"
         filepath = self.output_dir / filename
 
         # Flatten nested structure
@@ -982,13 +757,14 @@ class StateManager:
         self.state_file = Path(config['resume']['state_file'])
         self.state_file.parent.mkdir(parents=True, exist_ok=True)
         self.state = self.load_state()
+        # Set view of processed IDs for O(1) membership checks per grant
+        self.processed_ids = set(self.state.get("processed_ids", []))
         self.logger = logging.getLogger(__name__)
 
     def load_state(self) -> Dict:
         """Load state from file"""
         if self.state_file.exists():
-            with open(self.state_file, 'r') as f:
-                return json.load(f)
+            return orjson.loads(self.state_file.read_bytes())
         return {
             "last_run": None,
             "processed_ids": [],
@@ -997,22 +773,22 @@ class StateManager:
 
     def is_processed(self, external_id: str) -> bool:
         """Check if grant was already processed"""
-        return external_id in self.state.get("processed_ids", [])
+        return external_id in self.processed_ids
 
     def save_state(self, processed_ids: List[str]):
         """Save state to file"""
         self.state["last_run"] = datetime.now(timezone.utc).isoformat()
         self.state["processed_ids"] = processed_ids
         self.state["total_scraped"] = len(processed_ids)
+        self.processed_ids = set(processed_ids)
 
-        with open(self.state_file, 'w') as f:
-            json.dump(self.state, f, indent=2)
+        self.state_file.write_bytes(orjson.dumps(self.state, option=orjson.OPT_INDENT_2))
 
         self.logger.info(f"Saved state: {len(processed_ids)} processed grants")
 
 
 # ============================================================================
-# SECTION 7: Main Execution
+# SECTION 4: Main Execution
 # ============================================================================
 
 def main():
@@ -1069,7 +845,8 @@ def main():
 
     # Save state
     if config['resume']['enabled']:
-        state_mgr = StateManager(config)
+        # Reuse the crawler's loaded state instead of re-reading the state file
+        state_mgr = crawler.state_mgr or StateManager(config)
         processed_ids = [g.external_id for g in crawler.grants]
         state_mgr.save_state(processed_ids)
 
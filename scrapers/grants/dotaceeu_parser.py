@@ -0,0 +1,469 @@
+"""
+dotaceeu.cz detail page parsing
+
+Grant model and the pure HTML/text parsing used by the crawler. Kept apart
+from dotaceeu.py (Playwright, sub-scrapers) so process-pool workers import
+only what parsing needs, and so the worker function and the DotaceuGrant it
+returns pickle by an importable module name rather than __main__.
+"""
+
+import json
+import logging
+import re
+from dataclasses import dataclass, asdict
+from functools import lru_cache
+from datetime import datetime, timezone
+from typing import Optional, List, Dict
+
+import lxml.html
+
+# ============================================================================
+# SECTION 1: Data Models
+# ============================================================================
+
+
+@dataclass
+class DotaceuGrant:
+    """
+    Represents a grant from dotaceeu.cz
+
+    Handles two page types:
+    - Type A (Czech OPs): Full metadata including call_number, eligible_applicants
+    - Type B (EU direct): Simplified metadata, missing some fields
+    """
+
+    # Identifiers
+    external_id: str  # Call number OR URL slug (if no call number)
+    source_url: str  # Detail page URL
+
+    # Core metadata
+    call_number: Optional[str]  # Číslo výzvy (Type A only)
+    title: str
+    operational_programme: Optional[str]  # Operační program
+    programming_period: Optional[str]  # Programové období
+    priority_axis: Optional[str]  # Prioritní osa
+
+    # Call details
+    call_type: Optional[str]  # Průběžná/Kolová
+    call_status: Optional[str]  # Otevřená/Uzavřená/Plánovaná
+    eligible_applicants: Optional[str]  # Oprávnění žadatelé (Type A only - raw text)
+
+    # Dates (CRITICAL)
+    application_availability: Optional[datetime]  # Zpřístupnění žádosti o podporu
+    application_start: Optional[datetime]  # Zahájení příjmu
+    submission_deadline: Optional[datetime]  # Ukončení příjmu
+
+    # Funding
+    min_amount: Optional[float]  # Min support amount (from text parsing)
+    max_amount: Optional[float]  # Max support amount (from text parsing)
+    total_allocation: Optional[float]  # Total allocation if mentioned
+
+    # Content
+    description: Optional[str]
+    attached_documents: List[dict]  # [{url, title, type}] - empty in v1
+    application_link: Optional[str]  # Více informací na
+    all_urls: List[str]  # All URLs found in grant text
+
+    # Computed fields
+    is_ngo_eligible: bool  # Derived from eligible_applicants
+    page_type: str  # "type_a" or "type_b"
+
+    # Metadata
+    scraped_at: datetime
+
+    def to_dict(self):
+        """Convert to dictionary for JSON serialization"""
+        return {k: v.isoformat() if isinstance(v, datetime) else v for k, v in asdict(self).items()}
+
+    def to_grantio_format(self) -> dict:
+        """Convert to GrantSource-compatible JSON format"""
+        return {
+            "ExternalId": self.external_id,
+            "Title": self.title,
+            "WebSite": self.source_url,
+            "Data": json.dumps(self.to_dict()),
+        }
+
+
+# ============================================================================
+# SECTION 2: Utility Functions
+# ============================================================================
+
+# Precompiled patterns used on every scraped page
+CZECH_DATE_RE = re.compile(r"(\d{1,2})\.\s*(\d{1,2})\.\s*(\d{4})")  # day. month. year
+MARKUP_ARTIFACT_RE = re.compile(r"\*\*|<[^>]+>")
+IROP_CALL_NUMBER_RE = re.compile(r"(\d+)\.\s*výzva\s+IROP", re.IGNORECASE)  # "118. výzva IROP"
+CALL_NUMBER_RE = re.compile(r"(\d+)\.\s*výzva", re.IGNORECASE)  # "MŽP_98. výzva"
+
+
+@lru_cache(maxsize=1024)
+def parse_czech_date(text: str) -> Optional[datetime]:
+    """
+    Parse Czech date format: '9. 1. 2026' or '30. 4. 2026'
+
+    Memoized: grants share a small set of deadline strings, and the
+    returned datetime is immutable.
+
+    Returns datetime object or None if parsing fails
+    """
+    if not text:
+        return None
+
+    match = CZECH_DATE_RE.search(text)
+
+    if match:
+        day, month, year = match.groups()
+        try:
+            return datetime(int(year), int(month), int(day))
+        except ValueError as e:
+            logging.warning(f"Invalid date: {text} - {e}")
+            return None
+
+    return None
+
+
+@lru_cache(maxsize=16)
+def lowercase_keywords(keywords: tuple) -> tuple:
+    """Lowercase a keyword tuple once (memoized; the configured keywords never change)"""
+    return tuple(keyword.lower() for keyword in keywords)
+
+
+def is_ngo_eligible(text: str, keywords: List[str]) -> bool:
+    """
+    Check if eligible_applicants text contains NGO keywords (case-insensitive)
+
+    Keywords from validation: nadace, spolky, obecně prospěšné, etc.
+    """
+    if not text:
+        return False
+
+    text_lower = text.lower()
+    return any(keyword in text_lower for keyword in lowercase_keywords(tuple(keywords)))
+
+
+def generate_external_id(call_number: Optional[str], url: str) -> str:
+    """
+    Generate external_id: use call number if available, else URL slug
+
+    For Type B pages without call numbers, we prefix with 'slug_'
+    """
+    if call_number:
+        return call_number
+
+    # Fallback: extract URL slug
+    slug = url.rstrip("/").split("/")[-1]
+    return f"slug_{slug}"
+
+
+# ============================================================================
+# SECTION 3: HTML Parser
+# ============================================================================
+
+# Metadata labels extracted from detail pages (from validation)
+METADATA_FIELDS = (
+    "Číslo výzvy",
+    "Druh výzvy",
+    "Operační program",
+    "Prioritní osa",
+    "Oprávnění žadatelé",
+    "Zahájení příjmu žádostí",
+    "Ukončení příjmu žádostí",
+    "Stav výzvy",
+    "Programové období",
+    "Zpřístupnění žádosti o podporu",
+    "Více informací na",
+)
+
+# Pattern: "Field name:\s*\n*\s*(value)" for all fields in one alternation.
+# The value is captured inside a lookahead so the scan resumes right after
+# the colon and a label on the value line is still found on its own.
+METADATA_FIELD_RE = re.compile(
+    r"(?P<field>" + "|".join(re.escape(f) for f in METADATA_FIELDS) + r"):"
+    r"(?=\s*\n?\s*(?P<value>[^\n]+))"
+)
+
+# Page HTML arrives as str from Playwright; feed it to lxml as UTF-8 bytes with
+# the encoding pinned, so in-page XML/meta charset declarations are ignored
+UTF8_HTML_PARSER = lxml.html.HTMLParser(encoding="utf-8")
+
+
+def parse_html_document(html: str) -> lxml.html.HtmlElement:
+    """
+    Parse page HTML into an lxml tree, degrading like BeautifulSoup did
+
+    Empty, whitespace-only or comment-only markup yields an empty <html>
+    element (no text, no links) instead of raising ParserError.
+    """
+    if html and html.strip():
+        try:
+            return lxml.html.document_fromstring(html.encode("utf-8"), parser=UTF8_HTML_PARSER)
+        except lxml.etree.ParserError:
+            pass
+    return lxml.html.Element("html")
+
+
+def parse_grant_detail(
+    html: str, url: str, base_url: str, ngo_keywords: tuple, scraped_at: Optional[datetime] = None
+) -> Optional[DotaceuGrant]:
+    """
+    Parse grant detail page HTML into DotaceuGrant object
+
+    Handles both Type A (full metadata) and Type B (simplified) pages.
+    Takes only the config values it uses, so process-pool calls pickle a
+    URL and a keyword tuple instead of the whole config per page.
+    scraped_at defaults to now; the crawler passes one timestamp per run.
+    """
+    # Only text, the h1 and link hrefs are needed, so query the lxml tree
+    # directly instead of building a BeautifulSoup object tree
+    tree = parse_html_document(html)
+
+    # Get all text content once; metadata and funding parsing share it.
+    # Script/style/template bodies are not page text (as with soup.get_text())
+    for elem in tree.xpath("//script|//style|//template"):
+        elem.drop_tree()
+    page_text = tree.text_content()
+
+    # Extract metadata fields
+    info = extract_metadata_fields(page_text)
+
+    # Determine page type
+    page_type = determine_page_type(info)
+
+    # Extract title from h1
+    title_elems = tree.xpath("//h1")
+    title = "".join(t.strip() for t in title_elems[0].itertext()) if title_elems else "Untitled"
+
+    # Generate external ID
+    call_number = info.get("Číslo výzvy")
+    external_id = generate_external_id(call_number, url)
+
+    # Check NGO eligibility
+    eligible_text = info.get("Oprávnění žadatelé", "")
+    ngo_eligible = is_ngo_eligible(eligible_text, ngo_keywords)
+
+    # Extract all URLs from page
+    all_urls = extract_all_urls(tree.xpath("//a/@href", smart_strings=False), base_url)
+
+    # Extract funding amounts from text
+    min_amt, max_amt, total_alloc = extract_funding_amounts(page_text)
+
+    grant = DotaceuGrant(
+        external_id=external_id,
+        source_url=url,
+        call_number=call_number,
+        title=title,
+        operational_programme=info.get("Operační program"),
+        programming_period=info.get("Programové období"),
+        priority_axis=info.get("Prioritní osa"),
+        call_type=info.get("Druh výzvy"),
+        call_status=info.get("Stav výzvy"),
+        eligible_applicants=eligible_text if eligible_text else None,
+        application_availability=parse_czech_date(info.get("Zpřístupnění žádosti o podporu", "")),
+        application_start=parse_czech_date(info.get("Zahájení příjmu žádostí", "")),
+        submission_deadline=parse_czech_date(info.get("Ukončení příjmu žádostí", "")),
+        min_amount=min_amt,
+        max_amount=max_amt,
+        total_allocation=total_alloc,
+        description=None,  # Not available in current structure
+        attached_documents=[],  # PDFs use JS PostBack - skip in v1
+        application_link=info.get("Více informací na"),
+        all_urls=all_urls,
+        is_ngo_eligible=ngo_eligible,
+        page_type=page_type,
+        scraped_at=scraped_at or datetime.now(timezone.utc),
+    )
+
+    return grant
+
+
+def extract_metadata_fields(text: str) -> Dict[str, str]:
+    """
+    Extract metadata label-value pairs from page text
+
+    dotaceeu.cz uses plain text labels with values in <strong> tags,
+    NOT HTML tables as originally assumed
+    """
+    info = {}
+
+    # Single scan for all labels; the first occurrence of each label wins
+    for match in METADATA_FIELD_RE.finditer(text):
+        field = match.group("field")
+        if field in info:
+            continue
+
+        value = match.group("value").strip()
+        # Remove any remaining markup artifacts
+        value = MARKUP_ARTIFACT_RE.sub("", value)
+        info[field] = value
+
+        if len(info) == len(METADATA_FIELDS):
+            break
+
+    return info
+
+
+def determine_page_type(info: Dict[str, str]) -> str:
+    """
+    Determine if page is Type A (full metadata) or Type B (simplified)
+
+    Type A: Czech OPs with call_number and eligible_applicants
+    Type B: EU direct programs without these fields
+    """
+    has_call_number = "Číslo výzvy" in info
+    has_eligible_applicants = "Oprávnění žadatelé" in info
+
+    if has_call_number and has_eligible_applicants:
+        return "type_a"
+    else:
+        return "type_b"
+
+
+def extract_all_urls(hrefs: List[str], base_url: str) -> List[str]:
+    """
+    Extract all absolute URLs from grant page link hrefs
+
+    Returns deduplicated list of URLs found in links
+    """
+    urls = []
+
+    for href in hrefs:
+        # Convert to absolute URL
+        if href.startswith("http://") or href.startswith("https://"):
+            urls.append(href)
+        elif href.startswith("/"):
+            urls.append(base_url + href)
+        elif href.startswith("#"):
+            # Skip anchor links
+            continue
+        elif href.startswith("javascript:"):
+            # Skip javascript links
+            continue
+        else:
+            # Relative URL
+            urls.append(base_url + "/" + href)
+
+    # Deduplicate while preserving order
+    seen = set()
+    deduplicated = []
+    for url in urls:
+        if url not in seen:
+            seen.add(url)
+            deduplicated.append(url)
+
+    return deduplicated
+
+
+# Funding amount patterns (tried in order; first match wins)
+_AMOUNT_FLAGS = re.IGNORECASE | re.MULTILINE
+MIN_AMOUNT_RES = tuple(
+    re.compile(p, _AMOUNT_FLAGS)
+    for p in (
+        r"minim[aá]ln[íi]\s+[čc][aá]stka[:\s]+([^\n]+?)(?:Kč|$)",
+        r"minimum[:\s]+([^\n]+?)(?:Kč|$)",
+        r"od\s+([^\n]+?)\s+Kč",
+    )
+)
+MAX_AMOUNT_RES = tuple(
+    re.compile(p, _AMOUNT_FLAGS)
+    for p in (
+        r"maxim[aá]ln[íi]\s+[čc][aá]stka[:\s]+([^\n]+?)(?:Kč|$)",
+        r"maximum[:\s]+([^\n]+?)(?:Kč|$)",
+        r"do\s+([^\n]+?)\s+Kč",
+        r"až\s+([^\n]+?)\s+Kč",
+    )
+)
+ALLOCATION_RES = tuple(
+    re.compile(p, _AMOUNT_FLAGS)
+    for p in (
+        r"celkov[aá]\s+alokace[:\s]+([^\n]+?)(?:Kč|$)",
+        r"alokace[:\s]+([^\n]+?)(?:Kč|$)",
+        r"rozpočet[:\s]+([^\n]+?)(?:Kč|$)",
+        r"celkov[yý]\s+rozpočet[:\s]+([^\n]+?)(?:Kč|$)",
+    )
+)
+MILLIONS_RE = re.compile(r"([\d\s,\.]+)\s*mil", re.IGNORECASE)
+BILLIONS_RE = re.compile(r"([\d\s,\.]+)\s*mld", re.IGNORECASE)
+CZK_AMOUNT_RE = re.compile(r"([\d\s]+)\s*Kč")
+# Drop thousands separators (space, NBSP) and turn the decimal comma into a point
+AMOUNT_NUMBER_TABLE = str.maketrans({" ": None, "\u00a0": None, ",": "."})
+
+
+def extract_funding_amounts(text: str) -> tuple:
+    """
+    Extract min/max/total funding amounts from Czech text
+
+    Handles formats like:
+    - "500 mil. Kč" = 500 000 000
+    - "10 000 000 Kč" = 10 000 000
+    - "5,5 mil. Kč" = 5 500 000
+    - "minimální částka: X"
+    - "maximální částka: X"
+    - "celková alokace: X"
+
+    Returns: (min_amount, max_amount, total_allocation) in CZK
+    """
+    min_amt = None
+    max_amt = None
+    total_alloc = None
+
+    if not text:
+        return (min_amt, max_amt, total_alloc)
+
+    def parse_amount(amount_str: str) -> Optional[float]:
+        """Parse Czech currency format to float"""
+        if not amount_str:
+            return None
+
+        # Remove spaces and common separators
+        amount_str = amount_str.strip()
+
+        # Handle millions (mil. or miliónů)
+        if "mil" in amount_str.lower():
+            # Extract number before "mil"
+            match = MILLIONS_RE.search(amount_str)
+            if match:
+                num_str = match.group(1).translate(AMOUNT_NUMBER_TABLE)
+                try:
+                    return float(num_str) * 1_000_000
+                except ValueError:
+                    return None
+
+        # Handle billions (mld. or miliard)
+        if "mld" in amount_str.lower() or "miliard" in amount_str.lower():
+            match = BILLIONS_RE.search(amount_str)
+            if match:
+                num_str = match.group(1).translate(AMOUNT_NUMBER_TABLE)
+                try:
+                    return float(num_str) * 1_000_000_000
+                except ValueError:
+                    return None
+
+        # Handle plain numbers with spaces (e.g., "10 000 000 Kč")
+        if "Kč" not in amount_str:
+            return None
+        match = CZK_AMOUNT_RE.search(amount_str)
+        if match:
+            num_str = match.group(1).translate(AMOUNT_NUMBER_TABLE)
+            try:
+                return float(num_str)
+            except ValueError:
+                return None
+
+        return None
+
+    def first_amount(patterns: tuple) -> Optional[float]:
+        """Amount from the first pattern that yields one (later patterns are not scanned)"""
+        amount = None
+        for pattern in patterns:
+            match = pattern.search(text)
+            if match:
+                amount = parse_amount(match.group(1))
+                if amount:
+                    break
+        return amount
+
+    min_amt = first_amount(MIN_AMOUNT_RES)
+    max_amt = first_amount(MAX_AMOUNT_RES)
+    total_alloc = first_amount(ALLOCATION_RES)
+
+    return (min_amt, max_amt, total_alloc)
@@ -6,16 +6,66 @@ scraper implementation that inherits from this base class.
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Dict, List
 import logging
+import re
 from .models import GrantContent
+from .http_client import HttpClient
+
+# Precompiled patterns used on every scraped page
+EMAIL_RE = re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b")
+
+
+def compile_doc_type_patterns(doc_type_patterns: Dict[str, List[str]]) -> Optional[re.Pattern]:
+    """
+    Compile document type keyword patterns into a single regex.
+
+    Each type becomes one alternation branch with a lookahead over all of its
+    keywords, so the regex engine tries types in dict order and the first type
+    with any keyword in the title wins (same priority as a nested loop scan).
+
+    Args:
+        doc_type_patterns: Mapping of doc_type -> lowercase keywords
+
+    Returns:
+        Compiled pattern (matched type in ``match.lastgroup``), or None if empty
+    """
+    branches = [
+        f"(?=.*?(?:{'|'.join(re.escape(p) for p in patterns)}))(?P<{doc_type}>)"
+        for doc_type, patterns in doc_type_patterns.items()
+        if patterns
+    ]
+    if not branches:
+        return None
+    return re.compile("|".join(branches), re.DOTALL)
+
+
+@lru_cache(maxsize=4096)
+def match_doc_type(doc_type_re: re.Pattern, title: str) -> str:
+    """
+    Classify a title with a compiled doc type pattern (memoized).
+
+    Document titles repeat heavily across grants ("Text výzvy", "Příloha č. 1"),
+    so repeated titles skip both lowercasing and the regex scan.
+    """
+    match = doc_type_re.match(title.lower())
+    return match.lastgroup if match else "other"
 
 
 class AbstractGrantSubScraper(ABC):
     """Base class for site-specific grant content extraction"""
 
+    # Document type -> title keywords, in priority order (override per source)
+    DOC_TYPE_PATTERNS: Dict[str, List[str]] = {}
+
+    # Contact email pattern used by _extract_contact_email (override per source)
+    CONTACT_EMAIL_RE: re.Pattern = EMAIL_RE
+
     def __init__(self):
         self.logger = logging.getLogger(self.__class__.__name__)
+        self.http = HttpClient()
+        self._doc_type_re = compile_doc_type_patterns(self.DOC_TYPE_PATTERNS)
 
     @abstractmethod
     def can_handle(self, url: str) -> bool:
@@ -37,7 +87,7 @@ class AbstractGrantSubScraper(ABC):
 
         Args:
             url: Full URL to the grant detail page
-            grant_metadata: Metadata from dotaceeu.cz (title, call_number, etc.)
+            grant_metadata: Metadata from dotaceeu.cz (title, call_number, scraped_at, etc.)
 
         Returns:
             GrantContent object with description, documents, funding amounts, etc.
@@ -59,6 +109,35 @@ class AbstractGrantSubScraper(ABC):
         """
         pass
 
+    def _classify_document_type(self, title: str) -> str:
+        """
+        Classify document based on title keywords.
+
+        Args:
+            title: Document title (e.g., "Text výzvy", "Příručka pro žadatele")
+
+        Returns:
+            First matching key of DOC_TYPE_PATTERNS, or 'other'
+        """
+        if self._doc_type_re is None:
+            return "other"
+        return match_doc_type(self._doc_type_re, title)
+
+    def _extract_contact_email(self, text: str) -> Optional[str]:
+        """
+        Extract the first contact email from page text.
+
+        Args:
+            text: Page text (soup.get_text() output)
+
+        Returns:
+            Email address matching CONTACT_EMAIL_RE, or None
+        """
+        email_match = self.CONTACT_EMAIL_RE.search(text)
+        if email_match:
+            return email_match.group(0)
+        return None
+
     def get_scraper_name(self) -> str:
         """Return human-readable scraper name (e.g., 'OPSTCzScraper')"""
         return self.__class__.__name__
@@ -5,17 +5,27 @@ Extracts grant calls from Liferay portal-based employment programme website.
 """
 
 import re
-import logging
 from typing import Optional, List, Dict
 from datetime import datetime, timezone
 from urllib.parse import urljoin, urlparse
 
-import requests
 from bs4 import BeautifulSoup
 
 from .base import AbstractGrantSubScraper
 from .models import GrantContent, Document
-from .utils import download_document
+
+
+# Precompiled patterns used on every scraped page
+_CALL_NUMBER_RE = re.compile(r'Číslo[:\s]+(\d+)')  # "Číslo: 071"
+_DATE_RES = {  # "Platnost do: 5. 3. 2026 12:00"
+    'opens': re.compile(r'Platnost od[:\s]+([\d\.\s:]+)'),
+    'closes': re.compile(r'Platnost do[:\s]+([\d\.\s:]+)'),
+}
+_APPLICATIONS_RE = re.compile(r'Aplikací[:\s]+(\d+)')
+# "Alokace v Kč: 635 000 000"; the gap is bounded so a long line repeating "Alokace"
+# without an amount is not rescanned to its end from every occurrence
+_ALLOCATION_RE = re.compile(r'Alokace.{0,200}?(\d+(?:\s+\d{3})+)\s*[Kč]?')
+_APPLICATION_URL_RE = re.compile(r'https?://iskp21\.mssv\.cz[^\s]*')
 
 
 class ESFCRCzScraper(AbstractGrantSubScraper):
@@ -31,9 +41,6 @@ class ESFCRCzScraper(AbstractGrantSubScraper):
         'guidelines': ['příručka', 'pokyny'],
     }
 
-    def __init__(self):
-        self.logger = logging.getLogger(self.__class__.__name__)
-
     def can_handle(self, url: str) -> bool:
         """Check if URL is from esfcr.cz domain"""
         parsed = urlparse(url)
@@ -42,24 +49,27 @@ class ESFCRCzScraper(AbstractGrantSubScraper):
     async def extract_content(self, url: str, grant_metadata: dict) -> Optional[GrantContent]:
         """Extract content from esfcr.cz grant page"""
         try:
-            response = requests.get(url, timeout=10)
+            response = await self.http.get(url)
             response.raise_for_status()
             response.encoding = 'utf-8'
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml')
+
+            # Walk the DOM for text once; extractors below share it
+            page_text = soup.get_text()
 
             # Extract metadata from Czech text patterns
-            metadata = self._extract_metadata(soup)
+            metadata = self._extract_metadata(page_text)
             
             description = self._extract_description(soup)
-            funding = self._extract_funding(soup, metadata)
+            funding = self._extract_funding(page_text, metadata)
             documents = self._extract_documents(soup, url)
-            application_url = self._extract_application_url(soup)
-            contact_email = self._extract_contact_email(soup)
+            application_url = self._extract_application_url(page_text)
+            contact_email = self._extract_contact_email(page_text)
 
             content = GrantContent(
                 source_url=url,
                 scraper_name=self.get_scraper_name(),
-                scraped_at=datetime.now(timezone.utc),
+                scraped_at=grant_metadata.get('scraped_at') or datetime.now(timezone.utc),
                 description=description,
                 summary=grant_metadata.get('title'),
                 funding_amounts=funding,
@@ -77,28 +87,23 @@ class ESFCRCzScraper(AbstractGrantSubScraper):
             self.logger.error(f"Failed to extract from {url}: {e}")
             return None
 
-    def _extract_metadata(self, soup: BeautifulSoup) -> Dict:
+    def _extract_metadata(self, text: str) -> Dict:
         """Extract metadata from Czech text patterns"""
         metadata = {}
-        text = soup.get_text()
         
         # Extract call number: "Číslo: 071"
-        call_match = re.search(r'Číslo[:\s]+(\d+)', text)
+        call_match = _CALL_NUMBER_RE.search(text)
         if call_match:
             metadata['call_number'] = call_match.group(1)
         
         # Extract dates: "Platnost do: 5. 3. 2026 12:00"
-        date_patterns = {
-            'opens': r'Platnost od[:\s]+([\d\.\s:]+)',
-            'closes': r'Platnost do[:\s]+([\d\.\s:]+)',
-        }
-        for key, pattern in date_patterns.items():
-            match = re.search(pattern, text)
+        for key, pattern in _DATE_RES.items():
+            match = pattern.search(text)
             if match:
                 metadata[key] = match.group(1).strip()
         
         # Extract application count
-        app_match = re.search(r'Aplikací[:\s]+(\d+)', text)
+        app_match = _APPLICATIONS_RE.search(text)
         if app_match:
             metadata['applications'] = int(app_match.group(1))
         
@@ -115,17 +120,18 @@ class ESFCRCzScraper(AbstractGrantSubScraper):
                 # Skip empty and navigation paragraphs
                 if text and len(text) > 20:
                     text_parts.append(text)
-            return '\n\n'.join(text_parts[:10])  # First 10 substantial paragraphs
+                    if len(text_parts) == 10:  # First 10 substantial paragraphs
+                        break
+            return '\n\n'.join(text_parts)
         return None
 
-    def _extract_funding(self, soup: BeautifulSoup, metadata: Dict) -> Optional[Dict]:
+    def _extract_funding(self, text: str, metadata: Dict) -> Optional[Dict]:
         """Extract funding amounts"""
-        text = soup.get_text()
         
         # Pattern: "Alokace v Kč: 635 000 000"
-        alloc_match = re.search(r'Alokace.*?(\d+(?:\s+\d{3})+)\s*[Kč]?', text)
+        alloc_match = _ALLOCATION_RE.search(text)
         if alloc_match:
-            amount_str = alloc_match.group(1).replace(' ', '')
+            amount_str = ''.join(alloc_match.group(1).split())
             return {
                 'total': int(amount_str),
                 'currency': 'CZK',
@@ -152,7 +158,7 @@ class ESFCRCzScraper(AbstractGrantSubScraper):
                         file_format = ext
                         break
                 
-                doc_type = self._classify_document(title)
+                doc_type = self._classify_document_type(title)
                 
                 doc = Document(
                     title=title,
@@ -164,30 +170,13 @@ class ESFCRCzScraper(AbstractGrantSubScraper):
         
         return documents
 
-    def _classify_document(self, title: str) -> str:
-        """Classify document by title"""
-        title_lower = title.lower()
-        for doc_type, patterns in self.DOC_TYPE_PATTERNS.items():
-            if any(pattern in title_lower for pattern in patterns):
-                return doc_type
-        return 'other'
-
-    def _extract_application_url(self, soup: BeautifulSoup) -> Optional[str]:
+    def _extract_application_url(self, text: str) -> Optional[str]:
         """Extract application portal URL"""
-        text = soup.get_text()
-        url_match = re.search(r'https?://iskp21\.mssv\.cz[^\s]*', text)
+        url_match = _APPLICATION_URL_RE.search(text)
         if url_match:
             return url_match.group(0)
         return None
 
-    def _extract_contact_email(self, soup: BeautifulSoup) -> Optional[str]:
-        """Extract contact email"""
-        text = soup.get_text()
-        email_match = re.search(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', text)
-        if email_match:
-            return email_match.group(0)
-        return None
-
     async def download_document(self, doc_url: str, save_path: str) -> bool:
         """Download document"""
-        return download_document(doc_url, save_path)
+        return await self.http.download(doc_url, save_path)
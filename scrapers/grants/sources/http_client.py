@@ -0,0 +1,314 @@
+"""
+Shared HTTP client for grant sub-scrapers.
+
+Sub-scrapers are async, but requests is blocking. The client runs each
+request in a worker thread so page fetches never stall the event loop
+and several grants can be deep-scraped concurrently. A token-bucket rate
+limiter keeps the resulting bursts polite towards source sites, halving
+its rate when a site answers 429/503 and creeping back up on success.
+
+Responses carrying ETag/Last-Modified validators are cached on disk; the
+next fetch of the same URL is a conditional GET, and a 304 answer is served
+from the cache so unchanged pages are not downloaded again. Entries that
+have not been stored or revalidated for HTTP_CACHE_MAX_AGE_DAYS are pruned
+so the directory does not grow without bound. All clients share one cache
+per directory, opened and pruned once per run on the first request that
+needs it, so constructing a scraper touches no files.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Optional, Dict
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .utils import download_document
+
+# Well-named semantic constants
+DEFAULT_REQUEST_TIMEOUT_SECONDS = 10  # Timeout for grant detail page fetches
+DEFAULT_REQUESTS_PER_SECOND = 5  # Per-scraper request rate (override via REQUEST_RATE_LIMIT)
+DEFAULT_HTTP_CACHE_DIR = "./data/http_cache"  # Conditional GET cache; empty HTTP_CACHE_DIR disables
+DEFAULT_HTTP_CACHE_MAX_AGE_DAYS = 30  # Prune entries unused this long (HTTP_CACHE_MAX_AGE_DAYS)
+CACHE_COMPRESS_MIN_BYTES = 4096  # Smaller bodies are stored raw; zlib overhead outweighs the saving
+CACHE_COMPRESSION_LEVEL = 6  # zlib default; HTML pages shrink several-fold
+CONNECTION_POOL_SIZE = 32  # Keep-alive connections per host (concurrent grants x documents)
+MAX_RETRIES = 3  # Retries for connection errors and transient HTTP statuses
+RETRY_BACKOFF_FACTOR = 0.3  # 0.3s, 0.6s, 1.2s between retries
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+OVERLOAD_STATUS_CODES = (429, 503)  # Source asks us to slow down
+MIN_REQUESTS_PER_SECOND = 0.5  # Rate floor while a source keeps throttling
+RATE_RECOVERY_STEP = 0.1  # Requests/second regained per successful response
+
+
+class RateLimiter:
+    """Token-bucket rate limiter for async request paths (AIMD-adjusted)"""
+
+    def __init__(self, requests_per_second: float):
+        self.max_rate = requests_per_second
+        self.rate = requests_per_second
+        self.tokens = requests_per_second
+        self.last_refill = time.monotonic()
+
+    async def acquire(self):
+        """
+        Reserve a request token, then wait until it is due.
+
+        The token is taken immediately (the bucket may go into debt) and only
+        the wait happens after, so concurrent callers sleep in parallel for
+        their own slots instead of queueing behind one another's sleeps. No
+        lock is needed: the bookkeeping has no await, so it runs atomically
+        on the event loop.
+        """
+        now = time.monotonic()
+        self.tokens = min(self.rate, self.tokens + (now - self.last_refill) * self.rate)
+        self.last_refill = now
+        self.tokens -= 1
+
+        if self.tokens < 0:
+            await asyncio.sleep(-self.tokens / self.rate)
+
+    def on_overload(self):
+        """Halve the rate after a throttling response"""
+        self.rate = max(MIN_REQUESTS_PER_SECOND, self.rate / 2)
+
+    def on_success(self):
+        """Additively recover towards the configured rate"""
+        if self.rate < self.max_rate:
+            self.rate = min(self.max_rate, self.rate + RATE_RECOVERY_STEP)
+
+
+class HttpCache:
+    """
+    On-disk store of response bodies keyed by URL, with their validators.
+
+    Bodies of CACHE_COMPRESS_MIN_BYTES or more are stored zlib-compressed.
+    """
+
+    def __init__(self, cache_dir: str, max_age_days: float = DEFAULT_HTTP_CACHE_MAX_AGE_DAYS):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.prune(max_age_days)
+
+    def prune(self, max_age_days: float):
+        """Delete entries whose metadata was last written more than max_age_days ago"""
+        cutoff = time.time() - max_age_days * 86400
+        for meta_path in self.cache_dir.glob("*.json"):
+            try:
+                if meta_path.stat().st_mtime < cutoff:
+                    meta_path.unlink(missing_ok=True)
+                    meta_path.with_suffix(".body").unlink(missing_ok=True)
+            except OSError:
+                continue  # Removed concurrently, e.g. by another run sharing the directory
+
+    def _paths(self, url: str) -> tuple:
+        key = hashlib.blake2b(url.encode("utf-8"), digest_size=8).hexdigest()
+        return self.cache_dir / f"{key}.json", self.cache_dir / f"{key}.body"
+
+    def get(self, url: str) -> Optional[Dict]:
+        """Return cached entry (validators, headers, body) or None"""
+        meta_path, body_path = self._paths(url)
+        if not meta_path.exists() or not body_path.exists():
+            return None
+        try:
+            entry = json.loads(meta_path.read_text(encoding="utf-8"))
+            # The file name is a short hash; never serve another URL's page
+            if entry.get("url") != url:
+                return None
+            body = body_path.read_bytes()
+            entry["content"] = zlib.decompress(body) if entry.get("compressed") else body
+            return entry
+        except (OSError, ValueError, zlib.error):
+            return None
+
+    def touch(self, url: str):
+        """Mark an entry as still in use after a successful revalidation"""
+        meta_path, _ = self._paths(url)
+        try:
+            meta_path.touch()
+        except OSError:
+            pass
+
+    def set(self, url: str, response: requests.Response):
+        """Store response if it carries an ETag or Last-Modified validator"""
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return
+
+        meta_path, body_path = self._paths(url)
+        body = response.content
+        compressed = len(body) >= CACHE_COMPRESS_MIN_BYTES
+        entry = {
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "headers": {k: v for k, v in response.headers.items() if k.lower() == "content-type"},
+            "compressed": compressed,
+        }
+        body_path.write_bytes(zlib.compress(body, CACHE_COMPRESSION_LEVEL) if compressed else body)
+        meta_path.write_text(json.dumps(entry), encoding="utf-8")
+
+
+_shared_caches: Dict[str, HttpCache] = {}
+_shared_caches_lock = threading.Lock()
+
+
+def get_shared_cache(
+    cache_dir: str, max_age_days: float = DEFAULT_HTTP_CACHE_MAX_AGE_DAYS
+) -> HttpCache:
+    """
+    Return the process-wide HttpCache for a directory.
+
+    The first call creates the directory and prunes expired entries; later
+    calls (from other scrapers' clients or worker threads) reuse that cache.
+    """
+    with _shared_caches_lock:
+        cache = _shared_caches.get(cache_dir)
+        if cache is None:
+            cache = _shared_caches[cache_dir] = HttpCache(cache_dir, max_age_days)
+        return cache
+
+
+class HttpClient:
+    """Async facade over a pooled requests.Session"""
+
+    def __init__(
+        self,
+        timeout: int = DEFAULT_REQUEST_TIMEOUT_SECONDS,
+        requests_per_second: Optional[float] = None,
+        cache_dir: Optional[str] = None,
+    ):
+        self.timeout = timeout
+        self.session = self._create_session()
+        rate = requests_per_second or float(
+            os.getenv("REQUEST_RATE_LIMIT", DEFAULT_REQUESTS_PER_SECOND)
+        )
+        self.rate_limiter = RateLimiter(rate)
+        if cache_dir is None:
+            cache_dir = os.getenv("HTTP_CACHE_DIR", DEFAULT_HTTP_CACHE_DIR)
+        self.cache_dir = cache_dir
+        self.cache_max_age_days = float(
+            os.getenv("HTTP_CACHE_MAX_AGE_DAYS", DEFAULT_HTTP_CACHE_MAX_AGE_DAYS)
+        )
+        self._cache: Optional[HttpCache] = None
+        self.cache_hits = 0
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    @property
+    def cache(self) -> Optional[HttpCache]:
+        """Shared on-disk cache, opened on first use (None when disabled)"""
+        if self._cache is None and self.cache_dir:
+            self._cache = get_shared_cache(self.cache_dir, self.cache_max_age_days)
+        return self._cache
+
+    @staticmethod
+    def _create_session() -> requests.Session:
+        """Session with a keep-alive pool sized for concurrent use and retry/backoff"""
+        retry = Retry(
+            total=MAX_RETRIES,
+            backoff_factor=RETRY_BACKOFF_FACTOR,
+            status_forcelist=RETRY_STATUS_CODES,
+            raise_on_status=False,  # Hand the final response to the caller's raise_for_status
+        )
+        adapter = HTTPAdapter(
+            pool_connections=CONNECTION_POOL_SIZE,
+            pool_maxsize=CONNECTION_POOL_SIZE,
+            max_retries=retry,
+        )
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    async def get(self, url: str, **kwargs) -> requests.Response:
+        """
+        Fetch URL without blocking the event loop.
+
+        Args:
+            url: Full URL to fetch
+            **kwargs: Extra arguments passed to requests.Session.get
+
+        Returns:
+            requests.Response (caller is responsible for raise_for_status)
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        await self.rate_limiter.acquire()
+        response = await asyncio.to_thread(self._fetch, url, **kwargs)
+        if response.raw is None:
+            # Rebuilt from the cache after a 304; counted here, on the event loop
+            self.cache_hits += 1
+
+        if response.status_code in OVERLOAD_STATUS_CODES:
+            self.rate_limiter.on_overload()
+            self.logger.warning(
+                f"{url} answered {response.status_code}, "
+                f"slowing to {self.rate_limiter.rate:.2f} req/s"
+            )
+        elif response.ok:
+            self.rate_limiter.on_success()
+
+        return response
+
+    async def download(self, url: str, save_path: str) -> bool:
+        """
+        Stream a document to disk without blocking the event loop.
+
+        Args:
+            url: Full URL to document
+            save_path: Absolute path where file should be saved
+
+        Returns:
+            True if download succeeded, False otherwise
+        """
+        await self.rate_limiter.acquire()
+        return await asyncio.to_thread(download_document, url, save_path, session=self.session)
+
+    def _fetch(self, url: str, **kwargs) -> requests.Response:
+        """Blocking GET with conditional revalidation against the cache"""
+        cache = self.cache
+        if not cache:
+            return self.session.get(url, **kwargs)
+
+        cached = cache.get(url)
+        if cached:
+            headers = dict(kwargs.pop("headers", None) or {})
+            if cached.get("etag"):
+                headers.setdefault("If-None-Match", cached["etag"])
+            if cached.get("last_modified"):
+                headers.setdefault("If-Modified-Since", cached["last_modified"])
+            kwargs["headers"] = headers
+
+        response = self.session.get(url, **kwargs)
+
+        if response.status_code == 304 and cached:
+            cache.touch(url)
+            self.logger.debug(f"Not modified, serving from cache: {url}")
+            return self._cached_response(url, cached)
+
+        if response.status_code == 200:
+            try:
+                cache.set(url, response)
+            except OSError as e:
+                self.logger.warning(f"Failed to cache {url}: {e}")
+
+        return response
+
+    @staticmethod
+    def _cached_response(url: str, cached: Dict) -> requests.Response:
+        """Rebuild a 200 response from a cache entry"""
+        response = requests.Response()
+        response.status_code = 200
+        response.url = url
+        response.headers.update(cached.get("headers", {}))
+        response._content = cached["content"]
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        return response
@@ -6,17 +6,24 @@ Note: Domain redirects from irop.mmr.cz to irop.gov.cz
 """
 
 import re
-import logging
 from typing import Optional, List, Dict
 from datetime import datetime, timezone
 from urllib.parse import urljoin, urlparse
 
-import requests
 from bs4 import BeautifulSoup
 
 from .base import AbstractGrantSubScraper
 from .models import GrantContent, Document
-from .utils import download_document
+
+
+# Precompiled patterns used on every scraped page
+# Funding: "2 000 000 000 Kč" or "2 mld. Kč" (first match wins)
+_FUNDING_RES = (
+    (re.compile(r'(\d+)\s*mld\.?\s*[Kč€]'), 1000000000),
+    (re.compile(r'(\d+)\s*mil\.?\s*[Kč€]'), 1000000),
+    (re.compile(r'(\d+(?:\s+\d{3})+)\s*[Kč€]'), 1),
+)
+_CALL_NUMBER_RE = re.compile(r'(\d+)\.\s*výzva', re.IGNORECASE)  # "118. výzva IROP"
 
 
 class IROPGovCzScraper(AbstractGrantSubScraper):
@@ -32,9 +39,6 @@ class IROPGovCzScraper(AbstractGrantSubScraper):
         'annex': ['příloha'],
     }
 
-    def __init__(self):
-        self.logger = logging.getLogger(self.__class__.__name__)
-
     def can_handle(self, url: str) -> bool:
         """Check if URL is from irop domain"""
         parsed = urlparse(url)
@@ -44,10 +48,10 @@ class IROPGovCzScraper(AbstractGrantSubScraper):
         """Extract content from irop.gov.cz grant page"""
         try:
             # Follow redirects
-            response = requests.get(url, timeout=10, allow_redirects=True)
+            response = await self.http.get(url, allow_redirects=True)
             response.raise_for_status()
             response.encoding = 'utf-8'
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml')
 
             description = self._extract_description(soup)
             funding = self._extract_funding(soup)
@@ -57,7 +61,7 @@ class IROPGovCzScraper(AbstractGrantSubScraper):
             content = GrantContent(
                 source_url=response.url,  # Use final URL after redirects
                 scraper_name=self.get_scraper_name(),
-                scraped_at=datetime.now(timezone.utc),
+                scraped_at=grant_metadata.get('scraped_at') or datetime.now(timezone.utc),
                 description=description,
                 summary=grant_metadata.get('title'),
                 funding_amounts=funding,
@@ -83,24 +87,17 @@ class IROPGovCzScraper(AbstractGrantSubScraper):
             if content_div:
                 paragraphs = content_div.find_all('p')
                 if paragraphs:
-                    return '\n\n'.join(p.get_text(strip=True) for p in paragraphs if p.get_text(strip=True))
+                    return '\n\n'.join(text for p in paragraphs if (text := p.get_text(strip=True)))
         return None
 
     def _extract_funding(self, soup: BeautifulSoup) -> Optional[Dict]:
         """Extract funding amounts"""
         text = soup.get_text()
         
-        # Pattern: "2 000 000 000 Kč" or "2 mld. Kč"
-        patterns = [
-            (r'(\d+)\s*mld\.?\s*[Kč€]', 1000000000),
-            (r'(\d+)\s*mil\.?\s*[Kč€]', 1000000),
-            (r'(\d+(?:\s+\d{3})+)\s*[Kč€]', 1),
-        ]
-        
-        for pattern, multiplier in patterns:
-            match = re.search(pattern, text)
+        for pattern, multiplier in _FUNDING_RES:
+            match = pattern.search(text)
             if match:
-                num_str = match.group(1).replace(' ', '')
+                num_str = ''.join(match.group(1).split())
                 amount = int(num_str) * multiplier
                 # Determine currency
                 currency = 'EUR' if '€' in match.group(0) else 'CZK'
@@ -133,7 +130,7 @@ class IROPGovCzScraper(AbstractGrantSubScraper):
                         file_format = ext
                         break
                 
-                doc_type = self._classify_document(title)
+                doc_type = self._classify_document_type(title)
                 
                 doc = Document(
                     title=title,
@@ -145,14 +142,6 @@ class IROPGovCzScraper(AbstractGrantSubScraper):
         
         return documents
 
-    def _classify_document(self, title: str) -> str:
-        """Classify document by title"""
-        title_lower = title.lower()
-        for doc_type, patterns in self.DOC_TYPE_PATTERNS.items():
-            if any(pattern in title_lower for pattern in patterns):
-                return doc_type
-        return 'other'
-
     def _extract_metadata(self, soup: BeautifulSoup) -> Dict:
         """Extract metadata from page"""
         metadata = {}
@@ -164,7 +153,7 @@ class IROPGovCzScraper(AbstractGrantSubScraper):
             metadata['title'] = title_text
             
             # Extract call number: "118. výzva IROP"
-            call_match = re.search(r'(\d+)\.\s*výzva', title_text, re.IGNORECASE)
+            call_match = _CALL_NUMBER_RE.search(title_text)
             if call_match:
                 metadata['call_number'] = call_match.group(1)
         
@@ -172,4 +161,4 @@ class IROPGovCzScraper(AbstractGrantSubScraper):
 
     async def download_document(self, doc_url: str, save_path: str) -> bool:
         """Download document"""
-        return download_document(doc_url, save_path)
+        return await self.http.download(doc_url, save_path)
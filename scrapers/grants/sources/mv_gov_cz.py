@@ -6,18 +6,27 @@ collection, not web page content.
 """
 
 import re
-import logging
 from typing import Optional, List
 from datetime import datetime, timezone
 from pathlib import Path
 from urllib.parse import urljoin, urlparse
 
-import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer, Tag
 
 from .base import AbstractGrantSubScraper
 from .models import GrantContent, Document
-from .utils import download_document
+
+
+# Well-named semantic constants
+# Only the title and document list are read from these pages; skip building
+# a DOM for head, scripts, navigation and footer
+PAGE_STRAINER = SoupStrainer(['h1', 'li', 'a'])
+
+# Precompiled patterns used on every scraped page
+_TITLE_CALL_NUMBER_RE = re.compile(r'(\d+)\.\s*výzva', re.IGNORECASE)  # "17. výzva OP NSHV"
+_FILENAME_CALL_NUMBER_RE = re.compile(r'(\d{2}_\d{2}_\d{3})')  # "NSHV_Výzva_č._14_26_017.pdf"
+_FILE_SIZE_RE = re.compile(r'(\d+(?:\.\d+)?)\s*kB')
+_ASPX_FORMAT_RE = re.compile(r'\.([a-z]+)\.aspx$', re.IGNORECASE)  # "/soubor/x.pdf.aspx"
 
 
 class MVGovCzScraper(AbstractGrantSubScraper):
@@ -34,9 +43,6 @@ class MVGovCzScraper(AbstractGrantSubScraper):
         'revision': ['rev0', 'rev1', 'rev2', 'rev'],
     }
 
-    def __init__(self):
-        self.logger = logging.getLogger(self.__class__.__name__)
-
     def can_handle(self, url: str) -> bool:
         """Check if URL is from mv.gov.cz fondyeu section"""
         parsed = urlparse(url)
@@ -49,24 +55,30 @@ class MVGovCzScraper(AbstractGrantSubScraper):
         Note: Web pages have minimal content. Primary value is document extraction.
         """
         try:
-            response = requests.get(url, timeout=10)
+            response = await self.http.get(url)
             response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml', parse_only=PAGE_STRAINER)
+            if not soup.find():
+                # Unexpected markup - fall back to a full parse
+                soup = BeautifulSoup(response.content, 'lxml')
 
             # Extract title
             title_elem = soup.find('h1')
             title = title_elem.get_text(strip=True) if title_elem else grant_metadata.get('title', '')
 
+            # Document links feed both call number fallback and document list
+            doc_links = soup.select('a[href*="soubor/"]')
+
             # Extract call number (three-tier fallback)
-            call_number = self._extract_call_number(title, soup, url)
+            call_number = self._extract_call_number(title, doc_links, url)
 
             # Extract documents
-            documents = self._extract_documents(soup, url)
+            documents = self._extract_documents(doc_links, url)
 
             content = GrantContent(
                 source_url=url,
                 scraper_name=self.get_scraper_name(),
-                scraped_at=datetime.now(timezone.utc),
+                scraped_at=grant_metadata.get('scraped_at') or datetime.now(timezone.utc),
                 description=None,  # Not available on web page
                 summary=title,  # Use title as summary
                 funding_amounts=None,  # Not on web page (in PDF)
@@ -88,7 +100,7 @@ class MVGovCzScraper(AbstractGrantSubScraper):
             self.logger.error(f"Failed to extract from {url}: {e}")
             return None
 
-    def _extract_call_number(self, title: str, soup: BeautifulSoup, url: str) -> str:
+    def _extract_call_number(self, title: str, doc_links: List[Tag], url: str) -> str:
         """
         Extract call number with three-tier fallback strategy.
 
@@ -97,16 +109,15 @@ class MVGovCzScraper(AbstractGrantSubScraper):
         3. Return "unknown" and log warning
         """
         # Tier 1: Title pattern
-        match = re.search(r'(\d+)\.\s*výzva', title, re.IGNORECASE)
+        match = _TITLE_CALL_NUMBER_RE.search(title)
         if match:
             return match.group(1)
 
         # Tier 2: Document filename pattern (look for _XX_YY_ZZZ pattern)
-        doc_links = soup.select('a[href*="soubor/"]')
         for link in doc_links:
             filename = link.get('title', link.get_text())
             # Look for call number pattern like "14_26_017"
-            match = re.search(r'(\d{2}_\d{2}_\d{3})', filename)
+            match = _FILENAME_CALL_NUMBER_RE.search(filename)
             if match:
                 # Extract just the final number (e.g., "017" from "14_26_017")
                 parts = match.group(1).split('_')
@@ -117,11 +128,11 @@ class MVGovCzScraper(AbstractGrantSubScraper):
         self.logger.warning(f"Could not extract call number from {url}")
         return "unknown"
 
-    def _extract_documents(self, soup: BeautifulSoup, base_url: str) -> List[Document]:
-        """Extract document links from page"""
+    def _extract_documents(self, doc_links: List[Tag], base_url: str) -> List[Document]:
+        """Extract documents from the page's soubor/ links"""
         documents = []
 
-        for link in soup.select('a[href*="soubor/"]'):
+        for link in doc_links:
             try:
                 # Get full document name from title attribute
                 doc_title = link.get('title', link.get_text(strip=True))
@@ -138,7 +149,7 @@ class MVGovCzScraper(AbstractGrantSubScraper):
                 size = None
                 if li_elem:
                     li_text = li_elem.get_text()
-                    size_match = re.search(r'(\d+(?:\.\d+)?)\s*kB', li_text)
+                    size_match = _FILE_SIZE_RE.search(li_text)
                     if size_match:
                         size = size_match.group(1) + ' kB'
 
@@ -162,16 +173,6 @@ class MVGovCzScraper(AbstractGrantSubScraper):
 
         return documents
 
-    def _classify_document_type(self, title: str) -> str:
-        """Classify document based on title"""
-        title_lower = title.lower()
-
-        for doc_type, patterns in self.DOC_TYPE_PATTERNS.items():
-            if any(pattern in title_lower for pattern in patterns):
-                return doc_type
-
-        return 'other'
-
     def _get_file_format(self, url: str) -> str:
         """
         Extract file format from ASP.NET URL.
@@ -179,7 +180,7 @@ class MVGovCzScraper(AbstractGrantSubScraper):
         Pattern: /soubor/{filename}.{ext}.aspx
         Example: /soubor/NSHV_Výzva.pdf.aspx → 'pdf'
         """
-        match = re.search(r'\.([a-z]+)\.aspx$', url, re.IGNORECASE)
+        match = _ASPX_FORMAT_RE.search(url)
         if match:
             return match.group(1).lower()
 
@@ -189,4 +190,4 @@ class MVGovCzScraper(AbstractGrantSubScraper):
 
     async def download_document(self, doc_url: str, save_path: str) -> bool:
         """Download document from mv.gov.cz ASP.NET handler"""
-        return download_document(doc_url, save_path)
+        return await self.http.download(doc_url, save_path)
@@ -6,18 +6,30 @@ Handles multiple operational programmes (OP ST, OP TAK, NPO, Modernizační fond
 """
 
 import re
-import logging
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Tuple
 from datetime import datetime, timezone
 from pathlib import Path
 from urllib.parse import urljoin, urlparse
 
-import requests
 from bs4 import BeautifulSoup
 
 from .base import AbstractGrantSubScraper
 from .models import GrantContent, Document
-from .utils import download_document
+
+
+# Precompiled patterns used on every scraped page
+# Loan amounts: "od 500 tis. Kč", "do 50 mil. Kč", "500 000 – 10 000 000 Kč"
+_LOAN_MIN_RES = (
+    re.compile(r'(?:minimální|od)\s+(?:částka|výše)?\s*(\d+(?:\s*\d{3})*)\s*(?:tis\.|mil\.|mld\.)?\s*Kč', re.IGNORECASE),
+    re.compile(r'(\d+(?:\s*\d{3})*)\s*(?:tis\.|mil\.)\s*Kč\s*(?:minimálně|nejméně)', re.IGNORECASE),
+)
+_LOAN_MAX_RES = (
+    re.compile(r'(?:maximální|do|až)\s+(?:částka|výše)?\s*(\d+(?:\s*\d{3})*)\s*(?:tis\.|mil\.|mld\.)?\s*Kč', re.IGNORECASE),
+    re.compile(r'(\d+(?:\s*\d{3})*)\s*(?:tis\.|mil\.)\s*Kč\s*(?:maximálně|nejvýše)', re.IGNORECASE),
+)
+_INTEREST_RATE_RE = re.compile(r'(?:úroková sazba|úrok|interest rate)?\s*(\d+(?:[.,]\d+)?)\s*%', re.IGNORECASE)
+_LOAN_TERM_RE = re.compile(r'(?:splatnost|doba trvání|term)?\s*(\d+)(?:\s*[–-]\s*(\d+))?\s*let', re.IGNORECASE)
+_GRANT_COMPONENT_RE = re.compile(r'(?:dotace|grant|nenávratná část|podpora)?\s*(\d+)\s*%', re.IGNORECASE)
 
 
 class NRBCzScraper(AbstractGrantSubScraper):
@@ -41,9 +53,6 @@ class NRBCzScraper(AbstractGrantSubScraper):
         'annex': ['příloha', 'priloha', 'annex', 'attachment'],
     }
 
-    def __init__(self):
-        self.logger = logging.getLogger(self.__class__.__name__)
-
     def can_handle(self, url: str) -> bool:
         """Check if URL is from nrb.cz or nrinvesticni.cz"""
         parsed = urlparse(url)
@@ -52,9 +61,13 @@ class NRBCzScraper(AbstractGrantSubScraper):
     async def extract_content(self, url: str, grant_metadata: dict) -> Optional[GrantContent]:
         """Extract content from nrb.cz/nrinvesticni.cz page"""
         try:
-            response = requests.get(url, timeout=10)
+            response = await self.http.get(url)
             response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml')
+
+            # Walk the DOM for text once; extractors below share it
+            page_text = soup.get_text()
+            page_text_lower = page_text.lower()
 
             # Extract title
             title_elem = soup.find('h1')
@@ -64,29 +77,29 @@ class NRBCzScraper(AbstractGrantSubScraper):
             description = self._extract_description(soup)
 
             # Classify operational programme
-            programme = self._classify_programme(soup, url)
+            programme = self._classify_programme(soup, page_text_lower)
 
             # Extract financial parameters
-            financial_params = self._extract_financial_parameters(soup, programme)
+            financial_params = self._extract_financial_parameters(page_text, programme)
 
             # Detect suspension status
-            is_suspended = self._detect_suspension(soup)
+            is_suspended = self._detect_suspension(page_text_lower)
 
-            # Extract documents
-            documents = self._extract_documents(soup, url)
+            # Extract documents and application link in one pass over <a> tags
+            documents, application_url = self._extract_links(soup, url)
 
-            # Extract contact email (if not obfuscated)
-            contact_email = self._extract_contact_email(soup)
+            # Extract contact email (many are Cloudflare-obfuscated; those yield None)
+            contact_email = self._extract_contact_email(page_text)
 
             content = GrantContent(
                 source_url=url,
                 scraper_name=self.get_scraper_name(),
-                scraped_at=datetime.now(timezone.utc),
+                scraped_at=grant_metadata.get('scraped_at') or datetime.now(timezone.utc),
                 description=description,
                 summary=title,
                 funding_amounts=financial_params,  # Extended dict with loan parameters
                 documents=documents,
-                application_url=self._find_application_url(soup, url),
+                application_url=application_url,
                 contact_email=contact_email,
                 eligible_recipients=None,  # Text-based, defer to phase 2
                 additional_metadata={
@@ -111,22 +124,19 @@ class NRBCzScraper(AbstractGrantSubScraper):
         if content_div:
             # Get first few paragraphs
             paragraphs = content_div.find_all('p', limit=5)
-            description = '\n\n'.join(p.get_text(strip=True) for p in paragraphs if p.get_text(strip=True))
+            description = '\n\n'.join(text for p in paragraphs if (text := p.get_text(strip=True)))
             return description if description else None
         return None
 
-    def _classify_programme(self, soup: BeautifulSoup, url: str) -> Optional[str]:
+    def _classify_programme(self, soup: BeautifulSoup, page_text: str) -> Optional[str]:
         """
         Classify operational programme using pattern matching.
 
         Priority order:
         1. Breadcrumbs
         2. Title and description
-        3. Full page text
+        3. Full page text (already lowercased)
         """
-        # Get all text content
-        page_text = soup.get_text().lower()
-
         # Check breadcrumbs first (most reliable)
         breadcrumbs = soup.find('nav', class_='breadcrumb')
         if breadcrumbs:
@@ -150,13 +160,12 @@ class NRBCzScraper(AbstractGrantSubScraper):
 
         return None
 
-    def _extract_financial_parameters(self, soup: BeautifulSoup, programme: Optional[str]) -> Optional[Dict]:
+    def _extract_financial_parameters(self, text: str, programme: Optional[str]) -> Optional[Dict]:
         """
         Extract loan parameters from unstructured text.
 
         Returns extended funding_amounts dict with loan-specific fields.
         """
-        text = soup.get_text()
         params = {
             'type': 'loan',  # vs 'grant' for traditional grants
         }
@@ -165,41 +174,33 @@ class NRBCzScraper(AbstractGrantSubScraper):
         # Pattern: "od 500 tis. Kč" or "do 50 mil. Kč" or "500 000 – 10 000 000 Kč"
 
         # Min amount
-        min_patterns = [
-            r'(?:minimální|od)\s+(?:částka|výše)?\s*(\d+(?:\s*\d{3})*)\s*(?:tis\.|mil\.|mld\.)?\s*Kč',
-            r'(\d+(?:\s*\d{3})*)\s*(?:tis\.|mil\.)\s*Kč\s*(?:minimálně|nejméně)',
-        ]
-        for pattern in min_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _LOAN_MIN_RES:
+            match = pattern.search(text)
             if match:
-                amount_str = match.group(1).replace(' ', '')
+                amount_str = ''.join(match.group(1).split())
                 multiplier = self._get_multiplier(match.group(0))
                 params['loan_amount_min'] = int(amount_str) * multiplier
                 break
 
         # Max amount
-        max_patterns = [
-            r'(?:maximální|do|až)\s+(?:částka|výše)?\s*(\d+(?:\s*\d{3})*)\s*(?:tis\.|mil\.|mld\.)?\s*Kč',
-            r'(\d+(?:\s*\d{3})*)\s*(?:tis\.|mil\.)\s*Kč\s*(?:maximálně|nejvýše)',
-        ]
-        for pattern in max_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _LOAN_MAX_RES:
+            match = pattern.search(text)
             if match:
-                amount_str = match.group(1).replace(' ', '')
+                amount_str = ''.join(match.group(1).split())
                 multiplier = self._get_multiplier(match.group(0))
                 params['loan_amount_max'] = int(amount_str) * multiplier
                 break
 
         # Extract interest rate
         # Pattern: "0 %", "3 % p.a.", "úroková sazba 2,5 %"
-        rate_match = re.search(r'(?:úroková sazba|úrok|interest rate)?\s*(\d+(?:[.,]\d+)?)\s*%', text, re.IGNORECASE)
+        rate_match = _INTEREST_RATE_RE.search(text)
         if rate_match:
             rate_str = rate_match.group(1).replace(',', '.')
             params['interest_rate'] = float(rate_str)
 
         # Extract loan term
         # Pattern: "splatnost 15 let", "doba trvání 10 – 25 let"
-        term_match = re.search(r'(?:splatnost|doba trvání|term)?\s*(\d+)(?:\s*[–-]\s*(\d+))?\s*let', text, re.IGNORECASE)
+        term_match = _LOAN_TERM_RE.search(text)
         if term_match:
             params['term_years_min'] = int(term_match.group(1))
             if term_match.group(2):
@@ -209,7 +210,7 @@ class NRBCzScraper(AbstractGrantSubScraper):
 
         # Extract grant component
         # Pattern: "dotace 30 %", "grant 50 %", "nenávratná část 40 %"
-        grant_match = re.search(r'(?:dotace|grant|nenávratná část|podpora)?\s*(\d+)\s*%', text, re.IGNORECASE)
+        grant_match = _GRANT_COMPONENT_RE.search(text)
         if grant_match:
             params['grant_component_percent'] = int(grant_match.group(1))
 
@@ -225,9 +226,8 @@ class NRBCzScraper(AbstractGrantSubScraper):
             return 1_000_000_000
         return 1
 
-    def _detect_suspension(self, soup: BeautifulSoup) -> bool:
-        """Detect if programme is suspended"""
-        text = soup.get_text().lower()
+    def _detect_suspension(self, text: str) -> bool:
+        """Detect if programme is suspended (expects lowercased page text)"""
         suspension_keywords = [
             'pozastaveno',
             'pozastavená',
@@ -252,16 +252,31 @@ class NRBCzScraper(AbstractGrantSubScraper):
         else:
             return 'hybrid'  # Loan + grant combination
 
-    def _extract_documents(self, soup: BeautifulSoup, base_url: str) -> List[Document]:
-        """Extract document links from page"""
+    def _extract_links(self, soup: BeautifulSoup, base_url: str) -> Tuple[List[Document], Optional[str]]:
+        """
+        Extract document links and the application form/portal URL.
+
+        Both come from the page's links, so they are collected in a single
+        traversal instead of walking every <a> twice.
+
+        Returns:
+            (documents, application_url)
+        """
         documents = []
+        application_url = None
 
-        # Find all links to WordPress uploads or PDF files
         for link in soup.find_all('a', href=True):
             href = link['href']
+            href_lower = href.lower()
+
+            # First link containing "zadost" or "application" is the application URL
+            if application_url is None:
+                text = link.get_text().lower()
+                if any(keyword in href_lower or keyword in text for keyword in ['zadost', 'application', 'formular']):
+                    application_url = urljoin(base_url, href)
 
-            # Skip non-document links
-            if not any(ext in href.lower() for ext in ['.pdf', '.xlsx', '.xlsm', '.docx', '.zip', '/wp-content/uploads/']):
+            # Only WordPress uploads or PDF files are documents; skip the rest
+            if not any(ext in href_lower for ext in ['.pdf', '.xlsx', '.xlsm', '.docx', '.zip', '/wp-content/uploads/']):
                 continue
 
             try:
@@ -290,43 +305,8 @@ class NRBCzScraper(AbstractGrantSubScraper):
                 self.logger.warning(f"Failed to extract document from {href}: {e}")
                 continue
 
-        return documents
-
-    def _classify_document_type(self, title: str) -> str:
-        """Classify document based on title"""
-        title_lower = title.lower()
-
-        for doc_type, patterns in self.DOC_TYPE_PATTERNS.items():
-            if any(pattern in title_lower for pattern in patterns):
-                return doc_type
-
-        return 'other'
-
-    def _find_application_url(self, soup: BeautifulSoup, base_url: str) -> Optional[str]:
-        """Find application form/portal URL"""
-        # Look for links containing "zadost" or "application"
-        for link in soup.find_all('a', href=True):
-            href = link['href']
-            text = link.get_text().lower()
-
-            if any(keyword in href.lower() or keyword in text for keyword in ['zadost', 'application', 'formular']):
-                return urljoin(base_url, href)
-
-        return None
-
-    def _extract_contact_email(self, soup: BeautifulSoup) -> Optional[str]:
-        """
-        Extract contact email (if not Cloudflare-obfuscated).
-
-        Note: Many emails are obfuscated. Return None rather than trying to decode.
-        """
-        # Simple email regex for non-obfuscated emails
-        text = soup.get_text()
-        email_match = re.search(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', text)
-        if email_match:
-            return email_match.group(0)
-        return None
+        return documents, application_url
 
     async def download_document(self, doc_url: str, save_path: str) -> bool:
         """Download document from nrb.cz WordPress uploads"""
-        return download_document(doc_url, save_path)
+        return await self.http.download(doc_url, save_path)
@@ -15,12 +15,20 @@ from datetime import datetime, timezone
 from pathlib import Path
 from urllib.parse import urljoin, urlparse
 
-import requests
 from bs4 import BeautifulSoup
 
 from .base import AbstractGrantSubScraper
 from .models import GrantContent, Document
-from .utils import download_document, convert_document_to_markdown
+
+
+# Precompiled patterns used on every scraped page
+_AMOUNT_RE = re.compile(r'(\d+(?:\s+\d{3})*(?:\s+mil\.)?)\s*Kč')  # "215 000 000 Kč", "215 mil. Kč"
+_RECIPIENT_SPLIT_RE = re.compile(r'[,;]|\s+-\s+')
+# Whole amount string: "215 000 000 Kč", "50 mil. Kč", "5,5 mil. Kč" (decimals only with mil.)
+_CZECH_AMOUNT_RE = re.compile(
+    r'^\s*(?:Kč\s*)?(\d[\d \u00a0]*(?:[,.]\d+(?=\s*mil\.))?)\s*(mil\.)?\s*(?:Kč)?\s*$'
+)
+_DIGIT_GROUPING = str.maketrans('', '', ' \u00a0')  # Thousands separators to drop
 
 
 class OPSTCzScraper(AbstractGrantSubScraper):
@@ -39,6 +47,9 @@ class OPSTCzScraper(AbstractGrantSubScraper):
         'annex': ['příloha', 'annex', 'attachment'],
     }
 
+    # Fallback pattern for contact emails written as plain page text
+    CONTACT_EMAIL_RE = re.compile(r'[\w\.-]+@[\w\.-]+\.\w+')
+
     def can_handle(self, url: str) -> bool:
         """Check if URL is from opst.cz domain"""
         parsed = urlparse(url)
@@ -57,9 +68,9 @@ class OPSTCzScraper(AbstractGrantSubScraper):
         """
         try:
             # Fetch page HTML
-            response = requests.get(url, timeout=10)
+            response = await self.http.get(url)
             response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml')
 
             # Extract metadata from call-card rows
             metadata = self._extract_metadata(soup)
@@ -78,7 +89,7 @@ class OPSTCzScraper(AbstractGrantSubScraper):
             application_url = self._extract_application_url(soup)
 
             # Extract contact email
-            contact_email = self._extract_contact_email(soup)
+            contact_email = self._extract_mailto_email(soup)
 
             # Extract eligible recipients
             eligible_recipients = self._extract_eligible_recipients(soup, metadata)
@@ -87,7 +98,7 @@ class OPSTCzScraper(AbstractGrantSubScraper):
             content = GrantContent(
                 source_url=url,
                 scraper_name=self.get_scraper_name(),
-                scraped_at=datetime.now(timezone.utc),
+                scraped_at=grant_metadata.get('scraped_at') or datetime.now(timezone.utc),
                 description=description,
                 summary=summary,
                 funding_amounts=funding_amounts,
@@ -108,7 +119,7 @@ class OPSTCzScraper(AbstractGrantSubScraper):
 
     async def download_document(self, doc_url: str, save_path: str) -> bool:
         """Download document from opst.cz to local path"""
-        return download_document(doc_url, save_path)
+        return await self.http.download(doc_url, save_path)
 
     # ===== Extraction Methods =====
 
@@ -199,21 +210,16 @@ class OPSTCzScraper(AbstractGrantSubScraper):
 
         # Fallback: search in page text
         text = soup.get_text()
-        # Pattern: "215 000 000 Kč" or "215 mil. Kč"
-        amount_pattern = r'(\d+(?:\s+\d{3})*(?:\s+mil\.)?)\s*Kč'
-        matches = re.findall(amount_pattern, text)
-
-        if matches:
-            # Take the largest amount (likely total allocation)
-            amounts = [self._parse_czech_amount(m) for m in matches]
-            amounts = [a for a in amounts if a]  # Filter None values
-
-            if amounts:
-                return {
-                    'total': max(amounts),
-                    'currency': 'CZK',
-                    'source': 'page_text',
-                }
+        # Take the largest amount (likely total allocation), tracked while
+        # scanning instead of collecting every match first
+        amounts = (self._parse_czech_amount(m.group(1)) for m in _AMOUNT_RE.finditer(text))
+        largest = max(filter(None, amounts), default=None)
+        if largest:
+            return {
+                'total': largest,
+                'currency': 'CZK',
+                'source': 'page_text',
+            }
 
         return None
 
@@ -297,22 +303,16 @@ class OPSTCzScraper(AbstractGrantSubScraper):
 
         return None
 
-    def _extract_contact_email(self, soup: BeautifulSoup) -> Optional[str]:
-        """Extract contact email from page"""
+    def _extract_mailto_email(self, soup: BeautifulSoup) -> Optional[str]:
+        """Extract contact email from mailto links, falling back to the page text"""
         # Look for email addresses in mailto links
         email_link = soup.select_one('a[href^="mailto:"]')
         if email_link:
             email = email_link.get('href', '').replace('mailto:', '')
             return email
 
-        # Fallback: search for email pattern in text
-        text = soup.get_text()
-        email_pattern = r'[\w\.-]+@[\w\.-]+\.\w+'
-        match = re.search(email_pattern, text)
-        if match:
-            return match.group(0)
-
-        return None
+        # Fallback: search for CONTACT_EMAIL_RE in text
+        return super()._extract_contact_email(soup.get_text())
 
     def _extract_eligible_recipients(self, soup: BeautifulSoup, metadata: dict) -> Optional[List[str]]:
         """Extract list of eligible recipients"""
@@ -320,32 +320,13 @@ class OPSTCzScraper(AbstractGrantSubScraper):
         if 'Oprávnění žadatelé' in metadata:
             text = metadata['Oprávnění žadatelé']
             # Split by common separators
-            recipients = re.split(r'[,;]|\s+-\s+', text)
-            return [r.strip() for r in recipients if r.strip()]
+            recipients = _RECIPIENT_SPLIT_RE.split(text)
+            return [stripped for r in recipients if (stripped := r.strip())]
 
         return None
 
     # ===== Helper Methods =====
 
-    def _classify_document_type(self, title: str) -> str:
-        """
-        Classify document based on title keywords.
-
-        Args:
-            title: Document title (e.g., "Text výzvy", "Příručka pro žadatele")
-
-        Returns:
-            Document type: call_text, guidelines, template, budget, faq, annex, other
-        """
-        title_lower = title.lower()
-
-        for doc_type, patterns in self.DOC_TYPE_PATTERNS.items():
-            for pattern in patterns:
-                if pattern in title_lower:
-                    return doc_type
-
-        return 'other'
-
     def _get_file_format(self, url: str) -> str:
         """
         Extract file format from URL.
@@ -378,25 +359,10 @@ class OPSTCzScraper(AbstractGrantSubScraper):
         if not text:
             return None
 
-        # Remove currency symbol
-        text = text.replace('Kč', '').strip()
-
-        # Handle millions
-        if 'mil.' in text:
-            # Extract number before "mil."
-            num_str = text.replace('mil.', '').strip()
-            # Replace comma with dot for float parsing
-            num_str = num_str.replace(',', '.').replace(' ', '')
-            try:
-                num = float(num_str)
-                return int(num * 1_000_000)
-            except ValueError:
-                return None
-
-        # Handle regular numbers with spaces
-        # "215 000 000" → "215000000"
-        num_str = text.replace(' ', '')
-        try:
-            return int(num_str)
-        except ValueError:
+        match = _CZECH_AMOUNT_RE.match(text)
+        if not match:
             return None
+
+        number, millions = match.groups()
+        value = float(number.translate(_DIGIT_GROUPING).replace(',', '.'))
+        return int(value * 1_000_000) if millions else int(value)
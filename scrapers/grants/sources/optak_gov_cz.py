@@ -5,17 +5,19 @@ Extracts grant calls from custom Czech government website.
 """
 
 import re
-import logging
 from typing import Optional, List, Dict
 from datetime import datetime, timezone
 from urllib.parse import urljoin, urlparse
 
-import requests
 from bs4 import BeautifulSoup
 
 from .base import AbstractGrantSubScraper
 from .models import GrantContent, Document
-from .utils import download_document
+
+
+# Precompiled patterns used on every scraped page
+_MILLIONS_RE = re.compile(r'(\d+)\s*mil\.')  # "2 mil. Kč – 60 mil. Kč"
+_RECIPIENT_SPLIT_RE = re.compile(r'[,;]')
 
 
 class OPTAKGovCzScraper(AbstractGrantSubScraper):
@@ -31,9 +33,6 @@ class OPTAKGovCzScraper(AbstractGrantSubScraper):
         'annex': ['příloha'],
     }
 
-    def __init__(self):
-        self.logger = logging.getLogger(self.__class__.__name__)
-
     def can_handle(self, url: str) -> bool:
         """Check if URL is from optak.gov.cz domain"""
         parsed = urlparse(url)
@@ -42,10 +41,10 @@ class OPTAKGovCzScraper(AbstractGrantSubScraper):
     async def extract_content(self, url: str, grant_metadata: dict) -> Optional[GrantContent]:
         """Extract content from optak.gov.cz grant page"""
         try:
-            response = requests.get(url, timeout=10)
+            response = await self.http.get(url)
             response.raise_for_status()
             response.encoding = 'utf-8'
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml')
 
             # Extract metadata from div.item containers
             metadata = self._extract_metadata(soup)
@@ -59,7 +58,7 @@ class OPTAKGovCzScraper(AbstractGrantSubScraper):
             content = GrantContent(
                 source_url=url,
                 scraper_name=self.get_scraper_name(),
-                scraped_at=datetime.now(timezone.utc),
+                scraped_at=grant_metadata.get('scraped_at') or datetime.now(timezone.utc),
                 description=description,
                 summary=grant_metadata.get('title'),
                 funding_amounts=funding,
@@ -110,7 +109,7 @@ class OPTAKGovCzScraper(AbstractGrantSubScraper):
         if funding_key in metadata:
             text = metadata[funding_key]
             # Pattern: "2 mil. Kč – 60 mil. Kč"
-            amounts = re.findall(r'(\d+)\s*mil\.', text)
+            amounts = _MILLIONS_RE.findall(text)
             if amounts:
                 # Convert to CZK
                 min_amount = int(amounts[0]) * 1000000 if len(amounts) > 0 else None
@@ -148,7 +147,7 @@ class OPTAKGovCzScraper(AbstractGrantSubScraper):
                         size = parts[1].strip().rstrip(')')
                 
                 doc_url = urljoin(base_url, href)
-                doc_type = self._classify_document(title)
+                doc_type = self._classify_document_type(title)
                 
                 doc = Document(
                     title=title,
@@ -161,24 +160,16 @@ class OPTAKGovCzScraper(AbstractGrantSubScraper):
         
         return documents
 
-    def _classify_document(self, title: str) -> str:
-        """Classify document by title"""
-        title_lower = title.lower()
-        for doc_type, patterns in self.DOC_TYPE_PATTERNS.items():
-            if any(pattern in title_lower for pattern in patterns):
-                return doc_type
-        return 'other'
-
     def _extract_eligible_recipients(self, metadata: Dict) -> Optional[List[str]]:
         """Extract eligible recipients from metadata"""
         target_key = 'Cílová skupina'
         if target_key in metadata:
             text = metadata[target_key]
             # Split by common delimiters
-            recipients = [r.strip() for r in re.split(r'[,;]', text) if r.strip()]
+            recipients = [stripped for r in _RECIPIENT_SPLIT_RE.split(text) if (stripped := r.strip())]
             return recipients if recipients else None
         return None
 
     async def download_document(self, doc_url: str, save_path: str) -> bool:
         """Download document"""
-        return download_document(doc_url, save_path)
+        return await self.http.download(doc_url, save_path)
@@ -5,17 +5,20 @@ Extracts grant calls from WordPress-based environmental programme website.
 """
 
 import re
-import logging
 from typing import Optional, List, Dict
 from datetime import datetime, timezone
 from urllib.parse import urljoin, urlparse
 
-import requests
 from bs4 import BeautifulSoup
 
 from .base import AbstractGrantSubScraper
 from .models import GrantContent, Document
-from .utils import download_document
+
+
+# Precompiled patterns used on every scraped page
+_AMOUNT_RE = re.compile(r'(\d+(?:\s+\d{3})*(?:\s+mil\.)?)\s*Kč')  # "20 000 000 Kč" or "110 mil. Kč"
+_NON_DIGIT_RE = re.compile(r'[^\d]')
+_APPLICATION_URL_RE = re.compile(r'https?://iskp21\.mssf\.cz[^\s]*')
 
 
 class OPZPCzScraper(AbstractGrantSubScraper):
@@ -33,9 +36,6 @@ class OPZPCzScraper(AbstractGrantSubScraper):
         'annex': ['příloha'],
     }
 
-    def __init__(self):
-        self.logger = logging.getLogger(self.__class__.__name__)
-
     def can_handle(self, url: str) -> bool:
         """Check if URL is from opzp.cz domain"""
         parsed = urlparse(url)
@@ -44,23 +44,26 @@ class OPZPCzScraper(AbstractGrantSubScraper):
     async def extract_content(self, url: str, grant_metadata: dict) -> Optional[GrantContent]:
         """Extract content from opzp.cz grant page"""
         try:
-            response = requests.get(url, timeout=10)
+            response = await self.http.get(url)
             response.raise_for_status()
             response.encoding = 'utf-8'
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml')
+
+            # Walk the DOM for text once; extractors below share it
+            page_text = soup.get_text()
 
             # Extract all sections
             description = self._extract_description(soup)
-            funding = self._extract_funding(soup)
+            funding = self._extract_funding(page_text)
             documents = self._extract_documents(soup, url)
-            application_url = self._extract_application_url(soup)
-            contact_email = self._extract_contact_email(soup)
+            application_url = self._extract_application_url(page_text)
+            contact_email = self._extract_contact_email(page_text)
             eligible_recipients = self._extract_eligible_recipients(soup)
 
             content = GrantContent(
                 source_url=url,
                 scraper_name=self.get_scraper_name(),
-                scraped_at=datetime.now(timezone.utc),
+                scraped_at=grant_metadata.get('scraped_at') or datetime.now(timezone.utc),
                 description=description,
                 summary=grant_metadata.get('title'),
                 funding_amounts=funding,
@@ -83,24 +86,26 @@ class OPZPCzScraper(AbstractGrantSubScraper):
         content_div = soup.select_one('.entry-content, .content, main')
         if content_div:
             paragraphs = content_div.find_all('p')
-            return '\n\n'.join(p.get_text(strip=True) for p in paragraphs if p.get_text(strip=True))
+            return '\n\n'.join(text for p in paragraphs if (text := p.get_text(strip=True)))
         return None
 
-    def _extract_funding(self, soup: BeautifulSoup) -> Optional[Dict]:
+    def _extract_funding(self, text: str) -> Optional[Dict]:
         """Extract funding amounts from Czech format"""
-        text = soup.get_text()
-        
+        # The pattern ends in "Kč"; skip the digit-run scan on pages without it
+        if 'Kč' not in text:
+            return None
+
         # Pattern: "20 000 000 Kč" or "110 mil. Kč"
-        amount_match = re.search(r'(\d+(?:\s+\d{3})*(?:\s+mil\.)?)\s*Kč', text)
+        amount_match = _AMOUNT_RE.search(text)
         if amount_match:
             amount_str = amount_match.group(1)
             # Convert "110 mil." to 110000000
             if 'mil.' in amount_str:
-                num = int(re.sub(r'[^\d]', '', amount_str))
+                num = int(_NON_DIGIT_RE.sub('', amount_str))
                 amount = num * 1000000
             else:
-                # Remove spaces: "20 000 000" -> 20000000
-                amount = int(amount_str.replace(' ', ''))
+                # Remove any whitespace (incl. NBSP): "20 000 000" -> 20000000
+                amount = int(''.join(amount_str.split()))
             
             return {
                 'total': amount,
@@ -123,7 +128,7 @@ class OPZPCzScraper(AbstractGrantSubScraper):
                 file_format = href.split('.')[-1].lower()
                 
                 # Classify document
-                doc_type = self._classify_document(title)
+                doc_type = self._classify_document_type(title)
                 
                 doc = Document(
                     title=title,
@@ -135,30 +140,13 @@ class OPZPCzScraper(AbstractGrantSubScraper):
         
         return documents
 
-    def _classify_document(self, title: str) -> str:
-        """Classify document by title"""
-        title_lower = title.lower()
-        for doc_type, patterns in self.DOC_TYPE_PATTERNS.items():
-            if any(pattern in title_lower for pattern in patterns):
-                return doc_type
-        return 'other'
-
-    def _extract_application_url(self, soup: BeautifulSoup) -> Optional[str]:
+    def _extract_application_url(self, text: str) -> Optional[str]:
         """Extract application portal URL"""
-        text = soup.get_text()
-        url_match = re.search(r'https?://iskp21\.mssf\.cz[^\s]*', text)
+        url_match = _APPLICATION_URL_RE.search(text)
         if url_match:
             return url_match.group(0)
         return None
 
-    def _extract_contact_email(self, soup: BeautifulSoup) -> Optional[str]:
-        """Extract contact email"""
-        text = soup.get_text()
-        email_match = re.search(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', text)
-        if email_match:
-            return email_match.group(0)
-        return None
-
     def _extract_eligible_recipients(self, soup: BeautifulSoup) -> Optional[List[str]]:
         """Extract eligible recipients from 'Kdo může žádat' section"""
         # Find section header
@@ -172,4 +160,4 @@ class OPZPCzScraper(AbstractGrantSubScraper):
 
     async def download_document(self, doc_url: str, save_path: str) -> bool:
         """Download document"""
-        return download_document(doc_url, save_path)
+        return await self.http.download(doc_url, save_path)
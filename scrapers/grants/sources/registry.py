@@ -60,3 +60,7 @@ class SubScraperRegistry:
     def count(self) -> int:
         """Return number of registered scrapers"""
         return len(self._scrapers)
+
+    def cache_hits(self) -> int:
+        """Return number of pages served from the HTTP cache across scrapers"""
+        return sum(scraper.http.cache_hits for scraper in self._scrapers)
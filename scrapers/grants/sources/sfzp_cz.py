@@ -5,17 +5,24 @@ Extracts grant calls from WordPress-based modernization fund website.
 """
 
 import re
-import logging
 from typing import Optional, List, Dict
 from datetime import datetime, timezone
 from urllib.parse import urljoin, urlparse
 
-import requests
 from bs4 import BeautifulSoup
 
 from .base import AbstractGrantSubScraper
 from .models import GrantContent, Document
-from .utils import download_document
+
+
+# Precompiled patterns used on every scraped page
+# Funding: "3 000 000 000 Kč" or "3 mld. Kč" or "50 mil. Kč" (first match wins)
+_FUNDING_RES = (
+    (re.compile(r'(\d+)\s*mld\.?\s*Kč'), 1000000000),
+    (re.compile(r'(\d+)\s*mil\.?\s*Kč'), 1000000),
+    (re.compile(r'(\d+(?:\s+\d{3})+)\s*Kč'), 1),
+)
+_APPLICATION_URL_RE = re.compile(r'https?://zadosti\.sfzp\.[^\s]*')
 
 
 class SFZPCzScraper(AbstractGrantSubScraper):
@@ -33,8 +40,8 @@ class SFZPCzScraper(AbstractGrantSubScraper):
         'annex': ['příloha'],
     }
 
-    def __init__(self):
-        self.logger = logging.getLogger(self.__class__.__name__)
+    # Contact emails are limited to the fund's own @sfzp.* addresses
+    CONTACT_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@sfzp\.[A-Za-z]{2,}\b')
 
     def can_handle(self, url: str) -> bool:
         """Check if URL is from sfzp domain"""
@@ -44,23 +51,26 @@ class SFZPCzScraper(AbstractGrantSubScraper):
     async def extract_content(self, url: str, grant_metadata: dict) -> Optional[GrantContent]:
         """Extract content from sfzp.cz grant page"""
         try:
-            response = requests.get(url, timeout=10)
+            response = await self.http.get(url)
             response.raise_for_status()
             response.encoding = 'utf-8'
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml')
+
+            # Walk the DOM for text once; extractors below share it
+            page_text = soup.get_text()
 
             # Extract sections
             description = self._extract_description(soup)
-            funding = self._extract_funding(soup)
+            funding = self._extract_funding(page_text)
             documents = self._extract_documents(soup, url)
-            application_url = self._extract_application_url(soup)
-            contact_email = self._extract_contact_email(soup)
+            application_url = self._extract_application_url(page_text)
+            contact_email = self._extract_contact_email(page_text)
             eligible_recipients = self._extract_eligible_recipients(soup)
 
             content = GrantContent(
                 source_url=url,
                 scraper_name=self.get_scraper_name(),
-                scraped_at=datetime.now(timezone.utc),
+                scraped_at=grant_metadata.get('scraped_at') or datetime.now(timezone.utc),
                 description=description,
                 summary=grant_metadata.get('title'),
                 funding_amounts=funding,
@@ -83,24 +93,19 @@ class SFZPCzScraper(AbstractGrantSubScraper):
         entry = soup.select_one('.entry-content')
         if entry:
             paragraphs = entry.find_all('p')
-            return '\n\n'.join(p.get_text(strip=True) for p in paragraphs if p.get_text(strip=True))
+            return '\n\n'.join(text for p in paragraphs if (text := p.get_text(strip=True)))
         return None
 
-    def _extract_funding(self, soup: BeautifulSoup) -> Optional[Dict]:
+    def _extract_funding(self, text: str) -> Optional[Dict]:
         """Extract funding with Czech billion/million parsing"""
-        text = soup.get_text()
-        
-        # Pattern: "3 000 000 000 Kč" or "3 mld. Kč" or "50 mil. Kč"
-        patterns = [
-            (r'(\d+)\s*mld\.?\s*Kč', 1000000000),
-            (r'(\d+)\s*mil\.?\s*Kč', 1000000),
-            (r'(\d+(?:\s+\d{3})+)\s*Kč', 1),
-        ]
-        
-        for pattern, multiplier in patterns:
-            match = re.search(pattern, text)
+        # Every pattern ends in "Kč"; a substring check is far cheaper than three failed scans
+        if 'Kč' not in text:
+            return None
+
+        for pattern, multiplier in _FUNDING_RES:
+            match = pattern.search(text)
             if match:
-                num_str = match.group(1).replace(' ', '')
+                num_str = ''.join(match.group(1).split())
                 amount = int(num_str) * multiplier
                 return {
                     'total': amount,
@@ -127,7 +132,7 @@ class SFZPCzScraper(AbstractGrantSubScraper):
                             if title.lower() != 'stáhnout':
                                 doc_url = urljoin(self.BASE_URL, href)
                                 file_format = href.split('.')[-1].lower()
-                                doc_type = self._classify_document(title)
+                                doc_type = self._classify_document_type(title)
                                 
                                 doc = Document(
                                     title=title,
@@ -141,30 +146,13 @@ class SFZPCzScraper(AbstractGrantSubScraper):
         
         return documents
 
-    def _classify_document(self, title: str) -> str:
-        """Classify document by title"""
-        title_lower = title.lower()
-        for doc_type, patterns in self.DOC_TYPE_PATTERNS.items():
-            if any(pattern in title_lower for pattern in patterns):
-                return doc_type
-        return 'other'
-
-    def _extract_application_url(self, soup: BeautifulSoup) -> Optional[str]:
+    def _extract_application_url(self, text: str) -> Optional[str]:
         """Extract application portal URL"""
-        text = soup.get_text()
-        url_match = re.search(r'https?://zadosti\.sfzp\.[^\s]*', text)
+        url_match = _APPLICATION_URL_RE.search(text)
         if url_match:
             return url_match.group(0)
         return None
 
-    def _extract_contact_email(self, soup: BeautifulSoup) -> Optional[str]:
-        """Extract contact email"""
-        text = soup.get_text()
-        email_match = re.search(r'\b[A-Za-z0-9._%+-]+@sfzp\.[A-Za-z]{2,}\b', text)
-        if email_match:
-            return email_match.group(0)
-        return None
-
     def _extract_eligible_recipients(self, soup: BeautifulSoup) -> Optional[List[str]]:
         """Extract eligible recipients from 'Kdo může žádat' section"""
         for elem in soup.find_all(['h2', 'h3']):
@@ -176,4 +164,4 @@ class SFZPCzScraper(AbstractGrantSubScraper):
 
     async def download_document(self, doc_url: str, save_path: str) -> bool:
         """Download document"""
-        return download_document(doc_url, save_path)
+        return await self.http.download(doc_url, save_path)
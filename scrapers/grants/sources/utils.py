@@ -2,9 +2,18 @@
 Document conversion utilities for grant sub-scrapers.
 
 Converts PDF, XLSX, DOCX files to markdown format for LLM consumption.
+
+The converter libraries (pdfplumber, pandas, openpyxl, mammoth) are imported
+inside the functions that use them. Every sub-scraper imports this module for
+download_document, and pandas alone takes a few hundred milliseconds to
+import, so runs that convert nothing (or only one format) do not pay for all
+of them.
 """
 
 import logging
+import os
+import shutil
+from email.utils import formatdate, parsedate_to_datetime
 from pathlib import Path
 from typing import Optional, Dict
 import re
@@ -12,34 +21,36 @@ import re
 # Document download
 import requests
 
-# PDF conversion
-import pdfplumber
-
-# Excel conversion
-import pandas as pd
-from openpyxl import load_workbook
-
-# Word conversion
-import mammoth
-from markdownify import markdownify as md
-
 
 # Well-named semantic constants
-DOWNLOAD_CHUNK_SIZE_BYTES = 8192  # Standard chunk size for streaming downloads
+DOWNLOAD_CHUNK_SIZE_BYTES = 64 * 1024  # Copy buffer for streaming documents to disk
 DEFAULT_DOWNLOAD_TIMEOUT_SECONDS = 30  # Reasonable timeout for document downloads
 
+# Precompiled patterns
+_EXCESS_NEWLINES_RE = re.compile(r'\n{3,}')
+
 
 logger = logging.getLogger(__name__)
 
 
-def download_document(url: str, save_path: str, timeout: int = DEFAULT_DOWNLOAD_TIMEOUT_SECONDS) -> bool:
+def download_document(url: str, save_path: str, timeout: int = DEFAULT_DOWNLOAD_TIMEOUT_SECONDS,
+                      session: Optional[requests.Session] = None) -> bool:
     """
     Download document from URL to local path.
 
+    If the file is already on disk from an earlier run, the request is made
+    conditional on its modification time and a 304 answer keeps the local copy.
+    The body is streamed into a sibling ``.part`` file that only replaces the
+    target once complete, so an interrupted download never leaves a truncated
+    file behind to be revalidated (and kept) on later runs. The file's mtime is
+    set from the server's Last-Modified, so revalidation echoes the server's
+    own timestamp rather than the local clock.
+
     Args:
         url: Full URL to document
         save_path: Absolute path where file should be saved
         timeout: Request timeout in seconds
+        session: Optional pooled session to reuse connections
 
     Returns:
         True if download succeeded, False otherwise
@@ -48,13 +59,28 @@ def download_document(url: str, save_path: str, timeout: int = DEFAULT_DOWNLOAD_
         save_path_obj = Path(save_path)
         save_path_obj.parent.mkdir(parents=True, exist_ok=True)
 
-        response = requests.get(url, timeout=timeout, stream=True)
+        headers = {}
+        if save_path_obj.exists():
+            headers['If-Modified-Since'] = formatdate(save_path_obj.stat().st_mtime, usegmt=True)
+
+        response = (session or requests).get(url, timeout=timeout, stream=True, headers=headers)
+        if response.status_code == 304:
+            response.close()
+            logger.info(f"Not modified, keeping: {save_path}")
+            return True
         response.raise_for_status()
 
-        with open(save_path, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE_BYTES):
-                if chunk:
-                    f.write(chunk)
+        part_path = save_path_obj.with_name(save_path_obj.name + '.part')
+        try:
+            # Copy the raw stream in C instead of looping over chunks in Python
+            response.raw.decode_content = True
+            with response, open(part_path, 'wb') as f:
+                shutil.copyfileobj(response.raw, f, length=DOWNLOAD_CHUNK_SIZE_BYTES)
+            _set_mtime_from_last_modified(part_path, response.headers.get('Last-Modified'))
+            os.replace(part_path, save_path_obj)
+        except BaseException:
+            part_path.unlink(missing_ok=True)
+            raise
 
         logger.info(f"Downloaded: {url} → {save_path}")
         return True
@@ -77,6 +103,8 @@ def convert_pdf_to_markdown(pdf_path: str) -> Optional[str]:
         Markdown string or None if conversion failed
     """
     try:
+        import pdfplumber
+
         markdown_parts = []
 
         with pdfplumber.open(pdf_path) as pdf:
@@ -93,6 +121,10 @@ def convert_pdf_to_markdown(pdf_path: str) -> Optional[str]:
                         markdown_table = _table_to_markdown(table)
                         markdown_parts.append(f"### Table {table_num}\n\n{markdown_table}\n")
 
+                # Drop the page's parsed objects; pdf.pages otherwise keeps every
+                # page's chars/lines cached until the whole document is closed
+                page.close()
+
         result = "\n".join(markdown_parts)
         logger.info(f"Converted PDF to markdown: {pdf_path} ({len(result)} chars)")
         return result
@@ -116,26 +148,33 @@ def convert_xlsx_to_markdown(xlsx_path: str) -> Optional[str]:
         Markdown string or None if conversion failed
     """
     try:
-        markdown_parts = []
+        import pandas as pd
+        from openpyxl import load_workbook
 
-        # Read with pandas for data
-        excel_file = pd.ExcelFile(xlsx_path)
+        markdown_parts = []
 
-        for sheet_name in excel_file.sheet_names:
-            df = pd.read_excel(xlsx_path, sheet_name=sheet_name)
+        # Read with pandas for data; open the workbook once and parse each
+        # sheet from it (pd.read_excel per sheet would reload the whole file)
+        with pd.ExcelFile(xlsx_path) as excel_file:
+            for sheet_name in excel_file.sheet_names:
+                df = excel_file.parse(sheet_name)
 
-            # Skip empty sheets
-            if df.empty:
-                continue
+                # Skip empty sheets
+                if df.empty:
+                    continue
 
-            markdown_parts.append(f"## Sheet: {sheet_name}\n")
-            markdown_table = df.to_markdown(index=False)
-            markdown_parts.append(f"{markdown_table}\n")
+                markdown_parts.append(f"## Sheet: {sheet_name}\n")
+                markdown_table = df.to_markdown(index=False)
+                markdown_parts.append(f"{markdown_table}\n")
 
         # Extract formulas with openpyxl (if file contains formulas)
         try:
-            wb = load_workbook(xlsx_path, data_only=False)
-            formulas = _extract_formulas(wb)
+            # Read-only mode streams rows instead of building every cell object
+            wb = load_workbook(xlsx_path, read_only=True, data_only=False)
+            try:
+                formulas = _extract_formulas(wb)
+            finally:
+                wb.close()
             if formulas:
                 markdown_parts.append("\n## Formulas\n")
                 for cell_ref, formula in formulas.items():
@@ -163,6 +202,9 @@ def convert_docx_to_markdown(docx_path: str) -> Optional[str]:
         Markdown string or None if conversion failed
     """
     try:
+        import mammoth
+        from markdownify import markdownify as md
+
         # Step 1: DOCX → HTML with mammoth
         with open(docx_path, "rb") as docx_file:
             result = mammoth.convert_to_html(docx_file)
@@ -172,7 +214,7 @@ def convert_docx_to_markdown(docx_path: str) -> Optional[str]:
         markdown = md(html, heading_style="ATX")
 
         # Clean up excessive newlines
-        markdown = re.sub(r'\n{3,}', '\n\n', markdown)
+        markdown = _EXCESS_NEWLINES_RE.sub('\n\n', markdown)
 
         logger.info(f"Converted DOCX to markdown: {docx_path} ({len(markdown)} chars)")
         return markdown
@@ -212,6 +254,18 @@ def convert_document_to_markdown(file_path: str) -> Optional[str]:
 
 # ===== Helper Functions =====
 
+
+def _set_mtime_from_last_modified(path: Path, last_modified: Optional[str]):
+    """Stamp a downloaded file with the server's Last-Modified time (if parseable)"""
+    if not last_modified:
+        return
+    try:
+        mtime = parsedate_to_datetime(last_modified).timestamp()
+    except (TypeError, ValueError):
+        return
+    os.utime(path, (mtime, mtime))
+
+
 def _table_to_markdown(table: list) -> str:
     """
     Convert pdfplumber table (list of lists) to markdown table.
@@ -265,8 +319,10 @@ def _extract_formulas(workbook) -> Dict[str, str]:
 
         for row in sheet.iter_rows():
             for cell in row:
-                # Check if cell contains a formula
-                if cell.value and isinstance(cell.value, str) and cell.value.startswith('='):
+                # Cheap type tag check first; most cells are plain values
+                if cell.data_type != 'f':
+                    continue
+                if isinstance(cell.value, str) and cell.value.startswith('='):
                     cell_ref = f"{sheet_name}!{cell.coordinate}"
                     formulas[cell_ref] = cell.value
 
@@ -1,5 +1,9 @@
 """Základní testy pro scrapery."""
 
+import io
+from datetime import datetime
+from pathlib import Path
+
 import pytest
 
 
@@ -28,4 +32,278 @@ def test_grant_model():
     assert grant.source == "https://example.cz"
 
 
+def test_classify_document_type_priority():
+    """Test že klasifikace dokumentů respektuje pořadí DOC_TYPE_PATTERNS."""
+    from scrapers.grants.sources.opst_cz import OPSTCzScraper
+
+    scraper = OPSTCzScraper()
+
+    # 'call_text' je před 'annex', i když 'příloha' je v názvu dříve
+    assert scraper._classify_document_type("Příloha - Text výzvy") == "call_text"
+    assert scraper._classify_document_type("PŘÍRUČKA pro žadatele") == "guidelines"
+    assert scraper._classify_document_type("Seznam změn") == "other"
+
+
+def test_parse_czech_amount():
+    """Test parsování českých částek (mezery, nezlomitelné mezery, mil.)."""
+    from scrapers.grants.sources.opst_cz import OPSTCzScraper
+
+    scraper = OPSTCzScraper()
+
+    assert scraper._parse_czech_amount("215 000 000 Kč") == 215_000_000
+    assert scraper._parse_czech_amount("215\u00a0000 Kč") == 215_000
+    assert scraper._parse_czech_amount("5,5 mil. Kč") == 5_500_000
+    # Desetinná část bez "mil." není platná částka
+    assert scraper._parse_czech_amount("1.500 Kč") is None
+    assert scraper._parse_czech_amount("2,5 Kč") is None
+    assert scraper._parse_czech_amount("neuvedeno") is None
+    assert scraper._parse_czech_amount("") is None
+
+
+class _StubSession:
+    """Náhrada requests.Session vracející připravené odpovědi a zaznamenávající hlavičky."""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.sent_headers = []
+
+    def get(self, url, **kwargs):
+        self.sent_headers.append(dict(kwargs.get("headers") or {}))
+        return self.responses.pop(0)
+
+
+def _stub_response(status_code, body=b"", headers=None, raw=None):
+    """Sestaví requests.Response bez síťového spojení."""
+    import requests
+
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    response.raw = raw if raw is not None else io.BytesIO(body)
+    return response
+
+
+def test_download_document_discards_partial_file(tmp_path):
+    """Test že přerušené stažení nenechá useknutý soubor, který by pak 304 navždy ponechala."""
+    import requests
+    from scrapers.grants.sources.utils import download_document
+
+    class InterruptedStream(io.BytesIO):
+        def read(self, size=-1):
+            if self.tell():
+                raise requests.ConnectionError("spojení přerušeno")
+            return super().read(4)
+
+    url = "https://example.cz/vyzva.pdf"
+    save_path = tmp_path / "vyzva.pdf"
+    session = _StubSession(
+        _stub_response(200, raw=InterruptedStream(b"%PDF-1.7 obsah")),
+        _stub_response(200, b"%PDF-1.7 obsah", {"Last-Modified": "Wed, 01 Oct 2025 08:00:00 GMT"}),
+    )
+
+    assert download_document(url, str(save_path), session=session) is False
+    assert not save_path.exists()
+    assert list(tmp_path.iterdir()) == []
+
+    # Další běh nemá co revalidovat, takže soubor stáhne celý znovu
+    assert download_document(url, str(save_path), session=session) is True
+    assert "If-Modified-Since" not in session.sent_headers[1]
+    assert save_path.read_bytes() == b"%PDF-1.7 obsah"
+    assert save_path.stat().st_mtime == 1759305600
+
+
+def test_http_client_caches_and_revalidates(tmp_path):
+    """Test že odpověď 200 s validátorem se uloží a odpověď 304 vrátí obsah z cache."""
+    import asyncio
+    import json
+    import os
+    from scrapers.grants.sources.http_client import HttpClient
+
+    cache_dir = tmp_path / "http_cache"
+    client = HttpClient(cache_dir=str(cache_dir))
+    assert not cache_dir.exists()  # Konstruktor na disk nesahá
+
+    url = "https://example.cz/vyzva/1"
+    body = "<h1>Výzva č. 1</h1>".encode("utf-8")
+    client.session = _StubSession(
+        _stub_response(200, body, {"ETag": '"v1"', "Content-Type": "text/html; charset=utf-8"}),
+        _stub_response(304),
+    )
+
+    first = asyncio.run(client.get(url))
+    assert first.content == body
+    assert client.cache_hits == 0
+    (meta_path,) = cache_dir.glob("*.json")
+    assert json.loads(meta_path.read_text(encoding="utf-8"))["url"] == url
+
+    os.utime(meta_path, (0, 0))
+    second = asyncio.run(client.get(url))
+    assert client.session.sent_headers[1]["If-None-Match"] == '"v1"'
+    assert second.status_code == 200
+    assert second.text == "<h1>Výzva č. 1</h1>"
+    assert client.cache_hits == 1
+    assert meta_path.stat().st_mtime > 0  # Revalidace záznam označí jako používaný
+
+
+def test_http_cache_compression_and_url_check(tmp_path):
+    """Test že velká těla se ukládají komprimovaná a záznam jiné URL se nevrátí."""
+    import json
+    from scrapers.grants.sources.http_client import HttpCache, CACHE_COMPRESS_MIN_BYTES
+
+    cache = HttpCache(str(tmp_path))
+    url = "https://example.cz/velka-stranka"
+    body = b"<p>Alokace 635 000 000 K\xc4\x8d</p>\n" * (CACHE_COMPRESS_MIN_BYTES // 10)
+    cache.set(url, _stub_response(200, body, {"Last-Modified": "Wed, 01 Oct 2025 08:00:00 GMT"}))
+
+    (meta_path,) = tmp_path.glob("*.json")
+    entry = json.loads(meta_path.read_text(encoding="utf-8"))
+    assert entry["compressed"] is True
+    assert meta_path.with_suffix(".body").stat().st_size < len(body)
+    assert cache.get(url)["content"] == body
+
+    # Kolize krátkého hashe nebo zastaralý soubor: cizí záznam se neservíruje
+    entry["url"] = "https://example.cz/jina-stranka"
+    meta_path.write_text(json.dumps(entry), encoding="utf-8")
+    assert cache.get(url) is None
+
+
+def test_http_cache_prunes_stale_entries(tmp_path):
+    """Test že při otevření cache zmizí záznamy nepoužité déle než max_age_days."""
+    import os
+    import time
+    from scrapers.grants.sources.http_client import HttpCache
+
+    cache = HttpCache(str(tmp_path))
+    headers = {"ETag": '"v1"'}
+    cache.set("https://example.cz/stara", _stub_response(200, b"stara", headers))
+    cache.set("https://example.cz/nova", _stub_response(200, b"nova", headers))
+
+    old = time.time() - 40 * 86400
+    for path in cache._paths("https://example.cz/stara"):
+        os.utime(path, (old, old))
+
+    HttpCache(str(tmp_path), max_age_days=30)
+
+    assert cache.get("https://example.cz/stara") is None
+    assert cache.get("https://example.cz/nova")["content"] == b"nova"
+    assert len(list(tmp_path.iterdir())) == 2
+
+
+def test_rate_limiter_spacing_and_backoff():
+    """Test že souběžná volání acquire projdou v dávce a pak v rozestupech 1/rate."""
+    import asyncio
+    import time
+    from scrapers.grants.sources.http_client import RateLimiter, MIN_REQUESTS_PER_SECOND
+
+    async def acquire_all(limiter, count):
+        start = time.monotonic()
+
+        async def one():
+            await limiter.acquire()
+            return time.monotonic() - start
+
+        return sorted(await asyncio.gather(*(one() for _ in range(count))))
+
+    times = asyncio.run(acquire_all(RateLimiter(10), 13))
+    assert all(t < 0.05 for t in times[:10])  # Plný kbelík: 10 hned
+    assert times[10:] == pytest.approx([0.1, 0.2, 0.3], abs=0.05)
+
+    limiter = RateLimiter(4)
+    limiter.on_overload()
+    assert limiter.rate == 2
+    for _ in range(3):
+        limiter.on_overload()
+    assert limiter.rate == MIN_REQUESTS_PER_SECOND
+    for _ in range(100):
+        limiter.on_success()
+    assert limiter.rate == 4
+
+
+_DOTACEEU_DETAIL_HTML = """<?xml version="1.0" encoding="utf-8"?>
+<html><body>
+<script>var stav = "Stav výzvy: falešný";</script>
+<h1>118. výzva IROP – Sociální služby</h1>
+<div>Číslo výzvy:</div>
+<div><strong>05_24_118</strong></div>
+<div>Operační program: <strong>Integrovaný regionální operační program</strong></div>
+<div>Stav výzvy: <strong>Otevřená</strong></div>
+<div>Oprávnění žadatelé: <strong>Nestátní neziskové organizace, obce</strong></div>
+<div>Ukončení příjmu žádostí: <strong>30. 4. 2026</strong></div>
+<p>Celková alokace: 1\u00a0200 mil. Kč</p>
+<a href="/cs/dokumenty">Dokumenty</a> <a href="#obsah">Obsah</a>
+<a href="https://irop.gov.cz/vyzva-118">IROP</a> <a href="/cs/dokumenty">Znovu</a>
+</body></html>
+"""
+
+
+@pytest.fixture
+def dotaceeu_parser(monkeypatch):
+    """Parser dotaceeu.cz importovaný stejně jako v dotaceeu.py (skriptový import)."""
+    monkeypatch.syspath_prepend(str(Path(__file__).resolve().parents[1] / "scrapers" / "grants"))
+    import dotaceeu_parser
+
+    return dotaceeu_parser
+
+
+def test_dotaceeu_parse_grant_detail_metadata(dotaceeu_parser):
+    """Test že parser detailu výzvy vytáhne metadata, termín, alokaci a odkazy."""
+    grant = dotaceeu_parser.parse_grant_detail(
+        _DOTACEEU_DETAIL_HTML,
+        "https://www.dotaceeu.cz/cs/jak-ziskat-dotaci/vyzvy/118",
+        "https://www.dotaceeu.cz",
+        ("nestátní neziskové",),
+    )
+
+    assert grant.title == "118. výzva IROP – Sociální služby"
+    assert grant.call_number == "05_24_118"
+    assert grant.external_id == "05_24_118"
+    assert grant.operational_programme == "Integrovaný regionální operační program"
+    # Text ve <script> se nesmí dostat do metadat
+    assert grant.call_status == "Otevřená"
+    assert grant.eligible_applicants == "Nestátní neziskové organizace, obce"
+    assert grant.submission_deadline == datetime(2026, 4, 30)
+    assert grant.total_allocation == 1_200_000_000
+    assert grant.is_ngo_eligible is True
+    assert grant.page_type == "type_a"
+    # Kotvy jsou vynechány, duplicitní odkazy odstraněny
+    assert grant.all_urls == [
+        "https://www.dotaceeu.cz/cs/dokumenty",
+        "https://irop.gov.cz/vyzva-118",
+    ]
+
+
+def test_dotaceeu_extract_funding_amounts(dotaceeu_parser):
+    """Test parsování minimální/maximální částky a alokace (mezery, NBSP, mil., mld.)."""
+    extract = dotaceeu_parser.extract_funding_amounts
+
+    assert extract(
+        "Minimální částka: 1,5 mil. Kč\n"
+        "Maximální částka: 1\u00a0500 mil. Kč\n"
+        "Celková alokace: 2,4 mld. Kč"
+    ) == (1_500_000, 1_500_000_000, 2_400_000_000)
+    assert extract("Podpora od 0,5 mil. Kč do 12 mil. Kč.\nRozpočet: 300 mil. Kč") == (
+        500_000,
+        12_000_000,
+        300_000_000,
+    )
+    assert extract("Maximální částka: 1 500 mil. Kč") == (None, 1_500_000_000, None)
+    assert extract("Bez uvedených částek") == (None, None, None)
+
+
+@pytest.mark.parametrize(
+    "html",
+    ["", "   ", '<?xml version="1.0" encoding="utf-8"?>\n<html><body></body></html>'],
+)
+def test_dotaceeu_parse_grant_detail_empty_html(dotaceeu_parser, html):
+    """Test že prázdné HTML a HTML s XML deklarací nevyhodí výjimku."""
+    grant = dotaceeu_parser.parse_grant_detail(
+        html, "https://www.dotaceeu.cz/cs/vyzva-x", "https://www.dotaceeu.cz", ()
+    )
+
+    assert grant.title == "Untitled"
+    assert grant.call_number is None
+    assert grant.all_urls == []
+    assert grant.is_ngo_eligible is False
+
+
 # Přidejte další testy pro jednotlivé scrapery